@@ -27,9 +27,10 @@ if alembic_cfg.config_file_name is not None:
 
 # Set SQLAlchemy metadata for migrations
 target_metadata = Base.metadata
-print("Available tables in metadata:")
-for table_name in target_metadata.tables.keys():
-    print(f"- {table_name}")
+if os.getenv("ALEMBIC_VERBOSE") == "1":
+    print("Available tables in metadata:")
+    for table_name in target_metadata.tables:
+        print(f"- {table_name}")
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
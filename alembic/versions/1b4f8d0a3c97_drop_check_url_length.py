@@ -0,0 +1,27 @@
+"""drop check_url_length
+
+Revision ID: 1b4f8d0a3c97
+Revises: f2c6a8b4d175
+Create Date: 2026-10-15 12:46:09.384251
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b4f8d0a3c97'
+down_revision: Union[str, None] = 'f2c6a8b4d175'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only databases created with create_all() have this constraint
+    op.execute("ALTER TABLE links DROP CONSTRAINT IF EXISTS check_url_length")
+
+
+def downgrade() -> None:
+    op.create_check_constraint('check_url_length', 'links', 'LENGTH(url) <= 2083')
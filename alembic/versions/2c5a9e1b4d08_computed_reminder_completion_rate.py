@@ -0,0 +1,34 @@
+"""computed reminder_completion_rate
+
+Revision ID: 2c5a9e1b4d08
+Revises: 1b4f8d0a3c97
+Create Date: 2026-10-15 13:15:37.902846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c5a9e1b4d08'
+down_revision: Union[str, None] = '1b4f8d0a3c97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COMPLETION_RATE = (
+    "CASE WHEN completed_reminders + missed_reminders = 0 THEN 0.0 "
+    "ELSE CAST(completed_reminders AS FLOAT) / (completed_reminders + missed_reminders) END"
+)
+
+
+def upgrade() -> None:
+    # A plain column can't be turned into a generated one in place
+    op.drop_column('user_analytics', 'reminder_completion_rate')
+    op.add_column('user_analytics', sa.Column('reminder_completion_rate', sa.Float(), sa.Computed(COMPLETION_RATE, persisted=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('user_analytics', 'reminder_completion_rate')
+    op.add_column('user_analytics', sa.Column('reminder_completion_rate', sa.Float(), nullable=True))
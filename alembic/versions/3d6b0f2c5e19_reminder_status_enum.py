@@ -0,0 +1,58 @@
+"""reminder status enum
+
+Revision ID: 3d6b0f2c5e19
+Revises: 2c5a9e1b4d08
+Create Date: 2026-10-15 13:52:11.470293
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d6b0f2c5e19'
+down_revision: Union[str, None] = '2c5a9e1b4d08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+reminder_status = postgresql.ENUM(
+    'pending', 'sent', 'completed', 'missed', 'cancelled',
+    name='reminder_status'
+)
+
+
+def upgrade() -> None:
+    reminder_status.create(op.get_bind(), checkfirst=True)
+    # The partial index predicate compares status, so rebuild it around the type change
+    op.drop_index('idx_reminders_pending_due', table_name='reminders')
+    op.execute("UPDATE reminders SET status = 'pending' WHERE status IS NULL")
+    op.alter_column('reminders', 'status',
+               existing_type=sa.String(length=20),
+               type_=reminder_status,
+               nullable=False,
+               server_default='pending',
+               postgresql_using='status::reminder_status')
+    op.alter_column('reminders_archive', 'status',
+               existing_type=sa.String(length=20),
+               type_=reminder_status,
+               existing_nullable=True,
+               postgresql_using='status::reminder_status')
+    op.create_index('idx_reminders_pending_due', 'reminders', ['remind_at'], unique=False, postgresql_where=sa.text("status = 'pending'"))
+
+
+def downgrade() -> None:
+    op.drop_index('idx_reminders_pending_due', table_name='reminders')
+    op.alter_column('reminders_archive', 'status',
+               existing_type=reminder_status,
+               type_=sa.String(length=20),
+               existing_nullable=True)
+    op.alter_column('reminders', 'status',
+               existing_type=reminder_status,
+               type_=sa.String(length=20),
+               nullable=True,
+               server_default=None)
+    op.create_index('idx_reminders_pending_due', 'reminders', ['remind_at'], unique=False, postgresql_where=sa.text("status = 'pending'"))
+    reminder_status.drop(op.get_bind(), checkfirst=True)
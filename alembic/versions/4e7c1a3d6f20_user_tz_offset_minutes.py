@@ -0,0 +1,37 @@
+"""user tz_offset_minutes
+
+Revision ID: 4e7c1a3d6f20
+Revises: 3d6b0f2c5e19
+Create Date: 2026-10-15 14:31:48.265019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e7c1a3d6f20'
+down_revision: Union[str, None] = '3d6b0f2c5e19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('tz_offset_minutes', sa.Integer(), nullable=True))
+    # timezone held the offset in hours as text, e.g. '5.5'
+    op.execute(
+        "UPDATE users SET tz_offset_minutes = CAST(ROUND(CAST(timezone AS NUMERIC) * 60) AS INTEGER) "
+        "WHERE timezone IS NOT NULL"
+    )
+    op.drop_column('users', 'timezone')
+
+
+def downgrade() -> None:
+    op.add_column('users', sa.Column('timezone', sa.String(length=64), nullable=True))
+    op.execute(
+        "UPDATE users SET timezone = CAST(CAST(tz_offset_minutes AS NUMERIC) / 60 AS VARCHAR) "
+        "WHERE tz_offset_minutes IS NOT NULL"
+    )
+    op.drop_column('users', 'tz_offset_minutes')
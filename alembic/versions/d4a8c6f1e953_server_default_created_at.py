@@ -0,0 +1,38 @@
+"""server default created_at
+
+Revision ID: d4a8c6f1e953
+Revises: b71f3d2e8a64
+Create Date: 2026-10-15 10:41:52.806314
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8c6f1e953'
+down_revision: Union[str, None] = 'b71f3d2e8a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('users', 'links', 'reminders')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        # Backfill rows written before created_at was NOT NULL
+        op.execute(f"UPDATE {table} SET created_at = now() WHERE created_at IS NULL")
+        op.alter_column(table, 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=sa.text('now()'),
+               nullable=False)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=None,
+               nullable=True)
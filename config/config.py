@@ -1,14 +1,53 @@
 # config/config.py
 import os
+import hashlib
 import logging
 from pathlib import Path
+from functools import lru_cache
 from dotenv import load_dotenv
 
+# Resolved once at import instead of on every Config initialisation
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_ENV_PATH = PROJECT_ROOT / '.env'
+
+# Parsed settings keyed by a hash of the environment they were loaded from
+_SETTINGS_CACHE = {}
+
+def _hash_env(env):
+    """Stable digest of an environment snapshot"""
+    return hashlib.blake2b(repr(sorted(env.items())).encode(), digest_size=16).hexdigest()
+
+@lru_cache(maxsize=None)
+def _env_file_path(value):
+    """Path for an ENV_FILE value, cached per value"""
+    return Path(value)
+
 class Environment:
     DEVELOPMENT = 'development'
     TESTING = 'testing'
     PRODUCTION = 'production'
 
+# Integer settings as (name, default) pairs
+REQUIRED_INT_SETTINGS = (
+    ('DB_POOL_SIZE', 20),
+    ('DB_MAX_OVERFLOW', 40),
+)
+
+OPTIONAL_INT_SETTINGS = (
+    # Rate limiting
+    ('RATE_LIMIT_MESSAGES', 10),
+    ('RATE_LIMIT_LINKS', 5),
+    # Reminder settings
+    ('DEFAULT_REMINDER_HOUR', 9),
+    ('REMINDER_CHECK_INTERVAL', 300),  # 5 minutes
+    ('MISSED_REMINDER_THRESHOLD', 24),  # hours
+    # Timeouts
+    ('DB_CONNECTION_TIMEOUT', 10),
+    ('API_TIMEOUT', 30),
+    # Updates handled at once by the bot
+    ('CONCURRENT_UPDATES', 32),
+)
+
 class Config:
     _instance = None
     _initialized = False
@@ -37,41 +76,62 @@ class Config:
         
         # Check if we're in test mode
         if 'ENV_FILE' in os.environ:
-            env_path = Path(os.environ['ENV_FILE'])
-            self.logger.info(f"Loading test environment from: {env_path}")
-            if env_path.exists():
-                load_dotenv(env_path, override=True)
-                self.logger.info(f"Loaded test environment file")
+            env_path = _env_file_path(os.environ['ENV_FILE'])
+            self.logger.info("Loading test environment from: %s", env_path)
+            # load_dotenv is a no-op (returning False) when the file is missing
+            if load_dotenv(env_path, override=True):
+                self.logger.info("Loaded test environment file")
             else:
-                self.logger.warning(f"Test environment file not found: {env_path}")
+                self.logger.warning("Test environment file not found or empty: %s", env_path)
         else:
             # Normal environment loading
-            project_root = Path(__file__).parent.parent
-            env_path = project_root / '.env'
-            self.logger.info(f"Loading production environment from: {env_path}")
-            if env_path.exists():
-                load_dotenv(env_path, override=True)
+            self.logger.info("Loading production environment from: %s", DEFAULT_ENV_PATH)
+            if load_dotenv(DEFAULT_ENV_PATH, override=True):
                 self.logger.info("Loaded production environment file")
         
+        # Snapshot the environment once so settings are read from a plain dict
+        self._env = dict(os.environ)
+        
+        # Reuse previously parsed and validated settings for an identical environment
+        env_hash = _hash_env(self._env)
+        cached = _SETTINGS_CACHE.get(env_hash)
+        if cached is not None:
+            self.__dict__.update(cached)
+            self.logger.info("Reusing cached settings for environment: %s", self.ENVIRONMENT)
+            return
+        
         # Get environment setting
-        self.ENVIRONMENT = os.getenv('ENVIRONMENT', Environment.DEVELOPMENT)
-        self.logger.info(f"Environment set to: {self.ENVIRONMENT}")
+        self.ENVIRONMENT = self._get('ENVIRONMENT', Environment.DEVELOPMENT)
+        self.logger.info("Environment set to: %s", self.ENVIRONMENT)
         
         # Load all settings
         self._load_required_settings()
         self._load_optional_settings()
         self._validate_security_settings()
+        
+        _SETTINGS_CACHE[env_hash] = {
+            key: value for key, value in vars(self).items()
+            if key not in ('logger', '_initialized')
+        }
+    
+    def _get(self, key, default=None):
+        """Read a setting from the environment snapshot"""
+        return self._env.get(key, default)
+    
+    def _load_int_settings(self, settings):
+        """Load integer settings from (name, default) pairs"""
+        for key, default in settings:
+            setattr(self, key, int(self._get(key, str(default))))
     
     def _load_required_settings(self):
         """Load and validate required settings"""
         # Bot settings
-        self.TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
-        self.BOT_USERNAME = os.getenv('BOT_USERNAME')
+        self.TELEGRAM_TOKEN = self._get('TELEGRAM_TOKEN')
+        self.BOT_USERNAME = self._get('BOT_USERNAME')
 
         # Database settings
-        self.DATABASE_URL = os.getenv('DATABASE_URL')
-        self.DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
-        self.DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+        self.DATABASE_URL = self._get('DATABASE_URL')
+        self._load_int_settings(REQUIRED_INT_SETTINGS)
         
         # Validate required settings
         if not self.TELEGRAM_TOKEN:
@@ -84,35 +144,31 @@ class Config:
     def _load_optional_settings(self):
         """Load optional settings with defaults"""
         # Debug and logging
-        self.DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
-        self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-        self.LOG_FORMAT = os.getenv('LOG_FORMAT', 
+        self.DEBUG = self._get('DEBUG', 'False').lower() == 'true'
+        self.LOG_LEVEL = self._get('LOG_LEVEL', 'INFO')
+        self.LOG_FORMAT = self._get('LOG_FORMAT', 
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
         # Security settings
-        self.HASH_SALT = os.getenv('HASH_SALT')
-        self.ENCRYPTION_KEY = os.getenv('ENCRYPTION_KEY')
+        self.HASH_SALT = self._get('HASH_SALT')
+        self.ENCRYPTION_KEY = self._get('ENCRYPTION_KEY')
         
         # API Keys
-        self.GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
-        
-        # Rate limiting
-        self.RATE_LIMIT_MESSAGES = int(os.getenv('RATE_LIMIT_MESSAGES', '10'))
-        self.RATE_LIMIT_LINKS = int(os.getenv('RATE_LIMIT_LINKS', '5'))
+        self.GEMINI_API_KEY = self._get('GEMINI_API_KEY')
         
-        # Reminder settings
-        self.DEFAULT_REMINDER_HOUR = int(os.getenv('DEFAULT_REMINDER_HOUR', '9'))
-        self.REMINDER_CHECK_INTERVAL = int(os.getenv('REMINDER_CHECK_INTERVAL', '300'))  # 5 minutes
-        self.MISSED_REMINDER_THRESHOLD = int(os.getenv('MISSED_REMINDER_THRESHOLD', '24'))  # hours
+        # Schema bootstrap (production schema is managed by Alembic)
+        self.AUTO_CREATE_TABLES = self._get(
+            'AUTO_CREATE_TABLES',
+            str(self.ENVIRONMENT == Environment.TESTING)
+        ).lower() == 'true'
         
-        # Timeouts
-        self.DB_CONNECTION_TIMEOUT = int(os.getenv('DB_CONNECTION_TIMEOUT', '10'))
-        self.API_TIMEOUT = int(os.getenv('API_TIMEOUT', '30'))
+        # Rate limiting, reminder settings and timeouts
+        self._load_int_settings(OPTIONAL_INT_SETTINGS)
         
         # Production-only settings
         if self.ENVIRONMENT == Environment.PRODUCTION:
-            self.SENTRY_DSN = os.getenv('SENTRY_DSN')
-            self.REDIS_URL = os.getenv('REDIS_URL')
+            self.SENTRY_DSN = self._get('SENTRY_DSN')
+            self.REDIS_URL = self._get('REDIS_URL')
             
             # These are required in production
             if not self.SENTRY_DSN:
@@ -140,10 +196,24 @@ class Config:
     def reset(cls):
         """Reset the singleton instance (useful for testing)"""
         cls._instance = None
+        globals().pop('config', None)
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget settings parsed for previously seen environments"""
+        _SETTINGS_CACHE.clear()
 
     @classmethod
     def get_instance(cls):
         """Get or create Config instance"""
         if cls._instance is None:
             return cls()
-        return cls._instance
\ No newline at end of file
+        return cls._instance
+
+def __getattr__(name):
+    """Lazily create the shared Config instance on first `config` access"""
+    if name == 'config':
+        instance = Config.get_instance()
+        globals()['config'] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,29 +1,32 @@
-REGION_TIMEZONES = {
-    "North America": [
+from types import MappingProxyType
+
+# Immutable: region -> ((label, UTC offset in hours), ...)
+REGION_TIMEZONES = MappingProxyType({
+    "North America": (
         ("UTC-8 (Los Angeles, Vancouver)", -8),
         ("UTC-7 (Denver, Phoenix)", -7),
         ("UTC-6 (Chicago, Mexico City)", -6),
         ("UTC-5 (New York, Toronto)", -5),
         ("UTC-4 (Halifax, Santiago)", -4),
-    ],
-    "South America": [
+    ),
+    "South America": (
         ("UTC-5 (Lima, Bogota)", -5),
         ("UTC-4 (Santiago, Caracas)", -4),
         ("UTC-3 (São Paulo, Buenos Aires)", -3),
-    ],
-    "Europe": [
+    ),
+    "Europe": (
         ("UTC+0 (London, Dublin)", 0),
         ("UTC+1 (Paris, Berlin)", 1),
         ("UTC+2 (Helsinki, Athens)", 2),
         ("UTC+3 (Moscow, Istanbul)", 3),
-    ],
-    "Africa": [
+    ),
+    "Africa": (
         ("UTC+0 (Accra, Dakar)", 0),
         ("UTC+1 (Lagos, Algiers)", 1),
         ("UTC+2 (Cairo, Johannesburg)", 2),
         ("UTC+3 (Nairobi, Addis Ababa)", 3),
-    ],
-    "Asia": [
+    ),
+    "Asia": (
         ("UTC+4 (Dubai, Baku)", 4),
         ("UTC+5 (Karachi, Tashkent)", 5),
         ("UTC+5:30 (Mumbai, New Delhi)", 5.5),
@@ -31,16 +34,19 @@ REGION_TIMEZONES = {
         ("UTC+7 (Bangkok, Jakarta)", 7),
         ("UTC+8 (Beijing, Singapore)", 8),
         ("UTC+9 (Tokyo, Seoul)", 9),
-    ],
-    "Oceania": [
+    ),
+    "Oceania": (
         ("UTC+8 (Perth)", 8),
         ("UTC+9:30 (Darwin)", 9.5),
         ("UTC+10 (Sydney, Melbourne)", 10),
         ("UTC+12 (Auckland, Suva)", 12),
-    ],
-    "Middle East": [
+    ),
+    "Middle East": (
         ("UTC+2 (Jerusalem, Amman)", 2),
         ("UTC+3:30 (Tehran)", 3.5),
         ("UTC+4 (Dubai, Muscat)", 4),
-    ],
-}
\ No newline at end of file
+    ),
+})
+
+# Region order for the region picker
+REGIONS = tuple(REGION_TIMEZONES.keys())
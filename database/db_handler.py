@@ -1,70 +1,197 @@
+import asyncio
 import logging
+import threading
+from functools import lru_cache
 from contextlib import contextmanager
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import and_, bindparam, create_engine, delete, inspect, insert, make_url, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import QueuePool
-from models_dir.models import Base, User, Link, Reminder, UserAnalytics  # Added UserAnalytics
+from models_dir.models import Base, User, Link, Reminder, ReminderArchive, UserAnalytics  # Added UserAnalytics
+from models_dir.bulk import bulk_add_links
 from config.config import Config
 
 logger = logging.getLogger(__name__)
 
-class DatabaseHandler:
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(DatabaseHandler, cls).__new__(cls)
-        return cls._instance
+# Analytics action -> UserAnalytics counter column it increments
+ACTION_TO_COLUMN = {
+    'link_saved': 'total_links_saved',
+    'manual_reminder': 'manual_reminder_count',
+    'default_passive': 'default_passive_count',
+    'active_skip': 'active_skip_count',
+    'reminder_completed': 'completed_reminders',
+    'reminder_missed': 'missed_reminders',
+    'snooze': 'total_snoozes',
+}
+
+# Reminder states that are finished and can leave the hot reminders table
+ARCHIVE_STATUSES = ('completed', 'missed')
+ARCHIVE_AFTER_DAYS = 30
+
+# Columns copied verbatim from reminders into reminders_archive
+ARCHIVE_COLUMNS = (
+    'id', 'link_id', 'remind_at', 'is_default_time', 'is_snoozed',
+    'snooze_count', 'created_at', 'status', 'last_reminded_at',
+)
+
+# libpq TCP keepalive settings so broken connections are noticed without pre-ping
+POSTGRES_KEEPALIVES = {
+    'keepalives': 1,
+    'keepalives_idle': 30,
+    'keepalives_interval': 10,
+    'keepalives_count': 3,
+}
+
+# Dialect-specific INSERT constructs that support ON CONFLICT clauses
+_UPSERT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+def upsert_insert(session, model):
+    """Return an INSERT for model that supports on_conflict_* on this dialect"""
+    return _UPSERT_INSERTS[session.get_bind().dialect.name](model)
+
+def get_or_create_user(session, telegram_id, username=None, first_name=None):
+    """Return (user, created) in the caller's transaction; concurrent inserts for one telegram_id don't fail"""
+    # Insert in one statement; fall back to a lookup if the user exists
+    user = session.scalars(
+        upsert_insert(session, User)
+        .values(telegram_id=telegram_id, username=username, first_name=first_name)
+        .on_conflict_do_nothing(index_elements=['telegram_id'])
+        .returning(User)
+    ).first()
+    if user is not None:
+        return user, True
+    user = session.scalars(
+        select(User).where(User.telegram_id == telegram_id)
+    ).one()
+    return user, False
+
+@lru_cache(maxsize=None)
+def _analytics_upsert(dialect_name, columns):
+    """Counter upsert adding a bound delta to each of columns, built once and reused"""
+    stmt = _UPSERT_INSERTS[dialect_name](UserAnalytics).values(
+        user_id=bindparam('uid'),
+        **{column: bindparam(column) for column in columns}
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=['user_id'],
+        set_={column: getattr(UserAnalytics, column) + stmt.excluded[column] for column in columns}
+    )
+
+# Shared engine and session factory, built once per process
+_engine = None
+_session_factory = None
+_engine_lock = threading.Lock()
+
+def _session_scope_key():
+    """Scope sessions to the running asyncio task, or to the thread outside one"""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return id(task)
+    return threading.get_ident()
+
+def _create_missing_tables(engine):
+    """Create only the tables that don't exist yet"""
+    existing = set(inspect(engine).get_table_names())
+    missing = [
+        table for name, table in Base.metadata.tables.items()
+        if name not in existing
+    ]
+    if missing:
+        Base.metadata.create_all(engine, tables=missing, checkfirst=False)
+        logger.info(f"Created tables: {', '.join(t.name for t in missing)}")
+
+def _init_engine():
+    """Build the shared engine and session factory"""
+    global _engine, _session_factory
+    try:
+        # Get config instance when needed
+        config = Config.get_instance()
+        
+        # Enhanced pool settings
+        pool_settings = {
+            'poolclass': QueuePool,
+            'pool_size': config.DB_POOL_SIZE,
+            'max_overflow': config.DB_MAX_OVERFLOW,
+            'pool_timeout': 30,
+            'pool_recycle': 1800,
+            # No SELECT 1 per checkout; dead PostgreSQL connections are caught by TCP keepalives
+            'pool_pre_ping': False,
+            # Rows per multi-row VALUES statement for batched INSERTs
+            'insertmanyvalues_page_size': 1000
+        }
 
+        url = make_url(config.DATABASE_URL)
+        connect_args = {}
+        if url.get_backend_name() == 'postgresql':
+            connect_args.update(POSTGRES_KEEPALIVES)
+            # psycopg2 can also batch executemany UPDATE/DELETE statements
+            if url.get_driver_name() == 'psycopg2':
+                pool_settings['executemany_mode'] = 'values_plus_batch'
+
+        # Production-specific settings
+        if config.ENVIRONMENT == 'production':
+            connect_args['connect_timeout'] = config.DB_CONNECTION_TIMEOUT
+
+        if connect_args:
+            pool_settings['connect_args'] = connect_args
+
+        engine = create_engine(
+            config.DATABASE_URL,
+            **pool_settings
+        )
+        
+        if config.AUTO_CREATE_TABLES:
+            _create_missing_tables(engine)
+        _session_factory = scoped_session(
+            sessionmaker(bind=engine, expire_on_commit=False),
+            scopefunc=_session_scope_key
+        )
+        _engine = engine
+        logger.info("Database initialized successfully")
+        
+    except Exception as e:
+        logger.error(f"Database initialization failed: {str(e)}")
+        raise
+
+def get_engine():
+    """Return the shared engine, creating it on first use"""
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _init_engine()
+    return _engine
+
+def dispose_engine():
+    """Dispose the shared engine so the next access builds a new one"""
+    global _engine, _session_factory
+    with _engine_lock:
+        if _session_factory is not None:
+            _session_factory.remove()
+        if _engine is not None:
+            _engine.dispose()
+        _engine = None
+        _session_factory = None
+
+class DatabaseHandler:
     def __init__(self):
-        if not self._initialized:
-            self.init_db()
-            self._initialized = True
-    
-    def init_db(self):
-        try:
-            # Get config instance when needed
-            config = Config.get_instance()
-            
-            # Enhanced pool settings
-            pool_settings = {
-                'poolclass': QueuePool,
-                'pool_size': config.DB_POOL_SIZE,
-                'max_overflow': config.DB_MAX_OVERFLOW,
-                'pool_timeout': 30,
-                'pool_recycle': 1800,
-                'pool_pre_ping': True
-            }
-
-            # Production-specific settings
-            if config.ENVIRONMENT == 'production':
-                pool_settings.update({
-                    'connect_args': {
-                        'connect_timeout': config.DB_CONNECTION_TIMEOUT,
-                    }
-                })
-
-            self.engine = create_engine(
-                config.DATABASE_URL,
-                **pool_settings
-            )
-            
-            Base.metadata.create_all(self.engine)
-            self.SessionLocal = sessionmaker(
-                bind=self.engine,
-                expire_on_commit=False
-            )
-            logger.info("Database initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"Database initialization failed: {str(e)}")
-            raise
+        self.engine = get_engine()
+        self.SessionLocal = _session_factory
 
     def get_session(self):
-        """Get a new database session"""
+        """Get the session for the current task or thread"""
         return self.SessionLocal()
 
+    def remove_session(self):
+        """Close and discard the session for the current task or thread"""
+        self.SessionLocal.remove()
+
     @contextmanager
     def session_scope(self):
         """Context manager for database sessions"""
@@ -79,18 +206,22 @@ class DatabaseHandler:
         finally:
             session.close()
 
+    async def run_in_thread(self, work, *args):
+        """Run work(session, *args) in a worker thread with its own session, committing on success"""
+        def call():
+            try:
+                with self.session_scope() as session:
+                    return work(session, *args)
+            finally:
+                # Worker threads are reused, so discard the thread's session
+                self.remove_session()
+        return await asyncio.to_thread(call)
+
     def create_user(self, telegram_id, username=None, first_name=None):
         """Create a new user with secure session handling"""
         with self.session_scope() as session:
             try:
-                user = session.query(User).filter_by(telegram_id=telegram_id).first()
-                if not user:
-                    user = User(
-                        telegram_id=telegram_id,
-                        username=username,
-                        first_name=first_name
-                    )
-                    session.add(user)
+                user, _ = get_or_create_user(session, telegram_id, username, first_name)
                 return user
             except Exception as e:
                 logger.error(f"Error creating user: {str(e)}")
@@ -113,49 +244,67 @@ class DatabaseHandler:
                 logger.error(f"Error saving link: {str(e)}")
                 raise
 
-    def update_user_analytics(self, user_id, action_type, session=None):
-        """Update user analytics with proper error handling"""
-        session_created_here = False
-        try:
-            if session is None:
-                session = self.get_session()
-                session_created_here = True
+    def save_links_bulk(self, user_id, urls, remind_at):
+        """Save several links with their default reminders in one transaction.
+        
+        Returns a list of (link_id, reminder_id) tuples in the order of urls.
+        """
+        if not urls:
+            return []
+        with self.session_scope() as session:
+            try:
+                link_ids = bulk_add_links(session, [{'user_id': user_id, 'url': url} for url in urls])
+                reminder_ids = session.scalars(
+                    insert(Reminder).returning(Reminder.id, sort_by_parameter_order=True),
+                    [
+                        {'link_id': link_id, 'remind_at': remind_at, 'is_default_time': True}
+                        for link_id in link_ids
+                    ]
+                ).all()
+                return list(zip(link_ids, reminder_ids))
                 
-            analytics = session.query(UserAnalytics).filter_by(user_id=user_id).first()
-            if not analytics:
-                analytics = UserAnalytics(user_id=user_id)
-                session.add(analytics)
-                session.commit()  # Commit new analytics record
-            
-            # Update metrics based on action type
-            if action_type == 'link_saved':
-                analytics.total_links_saved += 1
-            elif action_type == 'manual_reminder':
-                analytics.manual_reminder_count += 1
-            elif action_type == 'default_passive':
-                analytics.default_passive_count += 1
-            elif action_type == 'active_skip':
-                analytics.active_skip_count += 1
-            elif action_type == 'reminder_completed':
-                analytics.completed_reminders += 1
-            elif action_type == 'reminder_missed':
-                analytics.missed_reminders += 1
-            elif action_type == 'snooze':
-                analytics.total_snoozes += 1
-            
-            session.commit()
+            except Exception as e:
+                logger.error(f"Error saving links in bulk: {str(e)}")
+                raise
+
+    def archive_reminders(self, session, older_than_days=ARCHIVE_AFTER_DAYS):
+        """Move finished reminders last sent before the cutoff into reminders_archive.
+        
+        The caller owns the session and commits it (e.g. via run_in_thread).
+        Returns the number of archived reminders.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        finished = and_(
+            Reminder.status.in_(ARCHIVE_STATUSES),
+            Reminder.last_reminded_at < cutoff
+        )
+        try:
+            session.execute(
+                insert(ReminderArchive).from_select(
+                    ARCHIVE_COLUMNS,
+                    select(*(Reminder.__table__.c[name] for name in ARCHIVE_COLUMNS)).where(finished)
+                )
+            )
+            result = session.execute(
+                delete(Reminder).where(finished).execution_options(synchronize_session=False)
+            )
+            return result.rowcount
             
         except Exception as e:
-            logger.error(f"Error updating analytics: {str(e)}")
-            if session:
-                session.rollback()
+            logger.error(f"Error archiving reminders: {str(e)}")
             raise
-        finally:
-            if session and session_created_here:
-                session.close()
+
+    def increment_analytics_many(self, session, column, deltas_by_user):
+        """Add per-user deltas to one analytics counter with a single executemany upsert"""
+        if not deltas_by_user:
+            return
+        dialect_name = session.get_bind().dialect.name
+        session.execute(
+            _analytics_upsert(dialect_name, (column,)),
+            [{'uid': user_id, column: delta} for user_id, delta in deltas_by_user.items()]
+        )
 
     @classmethod
     def reset(cls):
-        """Reset the singleton instance (useful for testing)"""
-        cls._instance = None
-        cls._initialized = False
\ No newline at end of file
+        """Drop the shared engine (useful for testing)"""
+        dispose_engine()
\ No newline at end of file
@@ -1,18 +1,43 @@
+import os
 import secrets
+from pathlib import Path
+
+# Generated keys are persisted here so reruns reuse them instead of rotating
+SECRETS_DIR = Path(__file__).resolve().parent / '.secrets'
+
+def _get_or_generate(name, generate):
+    """Read a persisted key, or generate it once and store it with 0600 permissions"""
+    path = SECRETS_DIR / name
+    try:
+        return path.read_text().strip()
+    except FileNotFoundError:
+        pass
+
+    SECRETS_DIR.mkdir(mode=0o700, exist_ok=True)
+    value = generate()
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        # Another run created it first; use that value
+        return path.read_text().strip()
+    with os.fdopen(fd, 'w') as f:
+        f.write(value)
+    return value
 
 def generate_security_keys():
     """Generate secure values for environment variables"""
     # Generate a secure salt (32 characters)
-    salt = secrets.token_hex(16)
-    
+    salt = _get_or_generate('hash_salt', lambda: secrets.token_hex(16))
+
     # Generate a secure encryption key (44 characters)
-    encryption_key = secrets.token_urlsafe(32)
-    
+    encryption_key = _get_or_generate('encryption_key', lambda: secrets.token_urlsafe(32))
+
     print("\n=== Generated Security Keys ===\n")
     print("Add these to your .env file:\n")
     print(f"HASH_SALT={salt}")
     print(f"ENCRYPTION_KEY={encryption_key}")
-    print("\nMake sure to keep these values secure and never commit them to version control!")
+    print(f"\nThese values are stored in {SECRETS_DIR} and reused on the next run.")
+    print("Make sure to keep these values secure and never commit them to version control!")
 
 if __name__ == "__main__":
-    generate_security_keys()
\ No newline at end of file
+    generate_security_keys()
@@ -1,20 +1,26 @@
 import sys
 import os
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from models_dir.models import Base
 from config.config import Config
 
 # Add the project root directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-engine = create_engine(Config.DATABASE_URL)
+# One-shot script, so don't keep pooled connections around
+config = Config.get_instance()
+engine = create_engine(config.DATABASE_URL, poolclass=NullPool)
 Session = sessionmaker(bind=engine)
 
 def init_db():
-    # Only create tables if they don't already exist
-    Base.metadata.create_all(engine)
+    # Only create tables if the database is empty
+    if inspect(engine).get_table_names():
+        print("Database already initialized.")
+        return
+    Base.metadata.create_all(engine, checkfirst=True)
     print("Database initialized.")
 
 if __name__ == "__main__":
-    init_db()
\ No newline at end of file
+    init_db()
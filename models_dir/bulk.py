@@ -0,0 +1,17 @@
+# models_dir/bulk.py
+from sqlalchemy import insert
+
+from models_dir.models import Link
+
+def bulk_add_links(session, rows):
+    """
+    Insert links with multi-row INSERT ... RETURNING and return their ids
+    in the order of rows. rows are dicts of Link column values.
+    """
+    rows = list(rows)
+    if not rows:
+        return []
+    return session.scalars(
+        insert(Link).returning(Link.id, sort_by_parameter_order=True),
+        rows
+    ).all()
@@ -1,27 +1,46 @@
 # models_dir/models.py
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Float, CheckConstraint, Index
+from sqlalchemy import create_engine, Column, Integer, BigInteger, String, DateTime, Boolean, ForeignKey, Text, Float, CheckConstraint, Index, UniqueConstraint, Computed, Enum
 from sqlalchemy.orm import declarative_base 
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import validates
-from datetime import datetime, timezone
+from sqlalchemy.sql import func
 from urllib.parse import urlparse
 import logging
 
 Base = declarative_base()
 
+# Native ENUM on PostgreSQL (4 bytes, integer compares), VARCHAR elsewhere
+REMINDER_STATUS = Enum(
+    'pending', 'sent', 'completed', 'missed', 'cancelled',
+    name='reminder_status'
+)
+
 class User(Base):
     __tablename__ = 'users'
     
     id = Column(Integer, primary_key=True)
-    telegram_id = Column(Integer, unique=True, nullable=False)
+    telegram_id = Column(BigInteger, unique=True, nullable=False)  # Telegram IDs can exceed 32 bits
     username = Column(String(255))
     first_name = Column(String(255))
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))  # Note the timezone=True
-    timezone = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # Note the timezone=True
+    tz_offset_minutes = Column(Integer, nullable=True)  # UTC offset, used as-is for time math
     has_set_timezone = Column(Boolean, default=False)
     is_premium = Column(Boolean, default=False)
     
     links = relationship("Link", back_populates="user")
+    # One-to-one (one analytics row per user)
+    analytics = relationship("UserAnalytics", uselist=False, back_populates="user")
+
+    @property
+    def timezone(self):
+        """UTC offset in hours as a string (the former timezone column's format)"""
+        if self.tz_offset_minutes is None:
+            return None
+        return str(self.tz_offset_minutes / 60)
+
+    @timezone.setter
+    def timezone(self, offset_hours):
+        self.tz_offset_minutes = None if offset_hours is None else round(float(offset_hours) * 60)
 
 class Link(Base):
     __tablename__ = 'links'
@@ -29,7 +48,7 @@ class Link(Base):
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     url = Column(String(2083), nullable=False)
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     is_read = Column(Boolean, default=False)
 
     # Relationships
@@ -38,8 +57,7 @@ class Link(Base):
 
     # Add essential constraints and indexes
     __table_args__ = (
-        # Check URL length
-        CheckConstraint('LENGTH(url) <= 2083', name='check_url_length'),
+        # URL length is enforced by VARCHAR(2083) itself
         # Check URL starts with http:// or https:// using SQLite compatible REGEXP
         CheckConstraint(
             "url LIKE 'http://%' OR url LIKE 'https://%'",
@@ -49,6 +67,15 @@ class Link(Base):
         Index('idx_links_user_created', user_id, created_at),
     )
 
+    @validates('url')
+    def validate_url(self, key, url):
+        """Reject non-http(s) and over-long URLs before they reach the database"""
+        if len(url) > 2083:
+            raise ValueError(f"URL must be at most 2083 characters: {url[:50]}")
+        if urlparse(url).scheme not in ('http', 'https'):
+            raise ValueError(f"URL must start with http:// or https://: {url[:50]}")
+        return url
+
 class Reminder(Base):
     __tablename__ = 'reminders'
     
@@ -58,12 +85,44 @@ class Reminder(Base):
     is_default_time = Column(Boolean, default=False)
     is_snoozed = Column(Boolean, default=False)
     snooze_count = Column(Integer, default=0)
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    status = Column(String(20), default='pending')
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    status = Column(REMINDER_STATUS, nullable=False, default='pending', server_default='pending')
     last_reminded_at = Column(DateTime(timezone=True))
     
     link = relationship("Link", back_populates="reminders")
 
+    __table_args__ = (
+        # Partial index for the scheduler's due-reminder poll; only pending rows are kept
+        Index(
+            'idx_reminders_pending_due', remind_at,
+            postgresql_where=(status == 'pending'),
+            sqlite_where=(status == 'pending')
+        ),
+        # FK lookups from links (cascade deletes, loading link.reminders)
+        Index('idx_reminders_link_id', link_id),
+        # Partial index for the missed-reminder sweep over sent, unsnoozed rows
+        Index(
+            'idx_reminders_sent_unsnoozed', last_reminded_at,
+            postgresql_where=((status == 'sent') & (is_snoozed == False)),
+            sqlite_where=((status == 'sent') & (is_snoozed == False))
+        ),
+    )
+
+class ReminderArchive(Base):
+    """Finished reminders moved out of the hot reminders table"""
+    __tablename__ = 'reminders_archive'
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)  # Original reminder id
+    link_id = Column(Integer, nullable=False)  # No FK so links can still be deleted
+    remind_at = Column(DateTime(timezone=True), nullable=False)
+    is_default_time = Column(Boolean, default=False)
+    is_snoozed = Column(Boolean, default=False)
+    snooze_count = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    status = Column(REMINDER_STATUS)
+    last_reminded_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
 class UserAnalytics(Base):
     __tablename__ = 'user_analytics'
     
@@ -85,8 +144,18 @@ class UserAnalytics(Base):
     # Conversion
     completed_reminders = Column(Integer, default=0)
     missed_reminders = Column(Integer, default=0)
-    reminder_completion_rate = Column(Float, default=0.0)
+    # Derived by the database whenever the counters change
+    reminder_completion_rate = Column(Float, Computed(
+        "CASE WHEN completed_reminders + missed_reminders = 0 THEN 0.0 "
+        "ELSE CAST(completed_reminders AS FLOAT) / (completed_reminders + missed_reminders) END",
+        persisted=True
+    ))
 
     # Relationship
-    user = relationship("User", backref="analytics")
+    user = relationship("User", back_populates="analytics")
+
+    # One analytics row per user (the target of the counter upserts)
+    __table_args__ = (
+        UniqueConstraint('user_id', name='uq_user_analytics_user_id'),
+    )
     
\ No newline at end of file
@@ -1,26 +1,47 @@
 import sys
 import os
+import argparse
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sqlalchemy import func, select, text
 from models_dir.models import Base, Link, Reminder
 from database.db_handler import DatabaseHandler
 
-def reset_tables():
-    db = DatabaseHandler()
-    Base.metadata.drop_all(db.engine)
-    Base.metadata.create_all(db.engine)
+def reset_tables(conn):
+    if conn.dialect.name == 'postgresql':
+        # Throwaway data: skip waiting on the WAL flush and the NOTICE chatter from DROP
+        conn.execute(text("SET LOCAL synchronous_commit = off"))
+        conn.execute(text("SET LOCAL client_min_messages = warning"))
+    Base.metadata.drop_all(conn)
+    Base.metadata.create_all(conn)
     print("Tables reset successfully")
 
-def check_data():
-    db = DatabaseHandler()
-    session = db.get_session()
-    try:
-        link_count = session.query(Link).count()
-        reminder_count = session.query(Reminder).count()
-        print(f"\nCurrent data:\nLinks: {link_count}\nReminders: {reminder_count}")
-    finally:
-        session.close()
+def check_data(conn, exact=False):
+    if not exact and conn.dialect.name == 'postgresql':
+        # Planner statistics: no table scan, but only as fresh as the last ANALYZE
+        estimates = dict(conn.execute(text(
+            "SELECT relname, reltuples::bigint FROM pg_class "
+            "WHERE relname IN ('links', 'reminders') AND relkind IN ('r', 'p')"
+        )).all())
+        link_count = f"~{max(estimates.get('links', 0), 0)}"
+        reminder_count = f"~{max(estimates.get('reminders', 0), 0)}"
+    else:
+        link_count, reminder_count = conn.execute(
+            select(
+                select(func.count()).select_from(Link).scalar_subquery(),
+                select(func.count()).select_from(Reminder).scalar_subquery()
+            )
+        ).one()
+    print(f"\nCurrent data:\nLinks: {link_count}\nReminders: {reminder_count}")
 
 if __name__ == "__main__":
-    reset_tables()
-    check_data()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Drop and recreate all tables")
+    parser.add_argument('--exact', action='store_true',
+                        help="count rows exactly instead of using PostgreSQL estimates")
+    args = parser.parse_args()
+
+    db = DatabaseHandler()
+    # Reset and check in one transaction on one connection
+    with db.engine.begin() as conn:
+        reset_tables(conn)
+        check_data(conn, exact=args.exact)
@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 # Standard library imports
+import asyncio
 import logging
 import re
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta, time
 
 # Third-party imports
@@ -13,19 +15,23 @@ from telegram.ext import (
     MessageHandler,
     filters,
     CallbackQueryHandler,
-    CallbackContext
+    CallbackContext,
+    TypeHandler
 )
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.orm import joinedload
 
 # Local imports
 from config.config import Config
-from config.timezones_config import REGION_TIMEZONES
-from database.db_handler import DatabaseHandler
+from config.timezones_config import REGION_TIMEZONES, REGIONS
+from database.db_handler import DatabaseHandler, get_or_create_user
 from models_dir.models import Link, Reminder, User, UserAnalytics
 from utils.url_extractor import extract_urls
 from utils.logging_config import setup_logging
 from utils.rate_limiter import RateLimiter
+from utils.analytics_buffer import AnalyticsBuffer
+from utils.user_cache import UserCache
 from utils.content_summarizer import ContentSummarizer
 
 # Initialize configuration, logging and components
@@ -33,6 +39,12 @@ config = Config.get_instance()
 setup_logging()
 logger = logging.getLogger(__name__)
 rate_limiter = RateLimiter()
+# Shared by all handlers so they reuse one engine and connection pool
+db_handler = DatabaseHandler()
+# Analytics events are queued here and written by flush_analytics_job
+analytics_buffer = AnalyticsBuffer(db_handler)
+# Recently seen users, so most updates skip the user lookup
+user_cache = UserCache()
 
 # Initialize content summarizer if Gemini API key is available
 content_summarizer = None
@@ -47,37 +59,47 @@ except Exception as e:
     logger.error(f"Failed to initialize content summarizer: {str(e)}")
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=4, max=10),
-    retry=retry_if_exception_type((NetworkError, TimedOut))
-)
+SEND_ATTEMPTS = 3
+
 async def send_message_with_retry(update, text, reply_markup=None):
-    """Send message with retry logic"""
-    try:
-        return await update.message.reply_text(
-            text,
-            reply_markup=reply_markup
-        )
-    except Exception as e:
-        logger.error(f"Error sending message: {str(e)}")
-        raise
+    """Send message, retrying network errors with exponential backoff (4s, 8s)"""
+    for attempt in range(SEND_ATTEMPTS):
+        try:
+            return await update.message.reply_text(
+                text,
+                reply_markup=reply_markup
+            )
+        except (NetworkError, TimedOut) as e:
+            logger.error(f"Error sending message: {str(e)}")
+            if attempt == SEND_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(min(10, 4 * 2 ** attempt))
+        except Exception as e:
+            logger.error(f"Error sending message: {str(e)}")
+            raise
+
+def _start_user(session, user_id, username):
+    """Blocking part of start; returns the CachedUser, creating the user on first contact"""
+    user = get_cached_user(session, user_id)
+    if not user:
+        # Updates run concurrently, so another one may be creating this user too
+        new_user, created = get_or_create_user(session, user_id)
+        session.commit()
+        user = user_cache.set(user_id, new_user)
+        if created:
+            # Log new user
+            logger.info(f"[USER_ACTIVITY] New user joined: @{username or user_id}")
+    return user
 
 async def start(update, context):
     user_id = update.message.from_user.id
-    db = DatabaseHandler()
-    session = None
     try:
-        session = db.get_session()
-        user = session.query(User).filter_by(telegram_id=user_id).first()
-        if not user:
-            user = User(telegram_id=user_id)
-            session.add(user)
-            session.commit()
-            # Log new user
-            logger.info(f"[USER_ACTIVITY] New user joined: @{update.effective_user.username or user_id}")
+        # The database work runs in a worker thread so the event loop keeps serving updates
+        user = await db_handler.run_in_thread(
+            _start_user, user_id, update.effective_user.username
+        )
 
-        if not user.timezone:
+        if user.tz_offset_minutes is None:
             await update.message.reply_text(
                 f"Hi {update.effective_user.first_name}! 👋\n"
                 "I can help you save links and send reminders.\n\n"
@@ -90,15 +112,8 @@ async def start(update, context):
             )
     except Exception as e:
         logger.error(f"Error in start command: {e}")
-        if session:
-            session.rollback()
-    finally:
-        if session:
-            session.close()
 
-async def privacy_command(update, context):
-    """Display privacy policy information"""
-    privacy_text = """
+PRIVACY_TEXT = """
 📋 Privacy Policy for Read Complete Bot
 
 Information We Collect:
@@ -123,11 +138,12 @@ This bot does not share your data with third parties.
 
 Last updated: February 2025
     """
-    await update.message.reply_text(privacy_text)
 
-async def help_command(update, context):
-    """Send a message when the command /help is issued."""
-    help_text = """
+async def privacy_command(update, context):
+    """Display privacy policy information"""
+    await update.message.reply_text(PRIVACY_TEXT)
+
+HELP_TEXT = """
     Here's what I can do:
     - Send me any link to save it
     - Use /list to see your saved links
@@ -135,36 +151,51 @@ async def help_command(update, context):
     - Use /privacy to see our privacy and data retention policy
     - Use /help to see this message
     """
-    await update.message.reply_text(help_text)
+
+async def help_command(update, context):
+    """Send a message when the command /help is issued."""
+    await update.message.reply_text(HELP_TEXT)
+
+# Confirmation keyboard for /delete_data
+DELETE_CONFIRM_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("Yes, delete my data", callback_data="confirm_delete"),
+        InlineKeyboardButton("No, keep my data", callback_data="cancel_delete")
+    ]
+])
 
 async def delete_data_command(update, context):
     """Let users delete all their data"""
-    user_id = update.message.from_user.id
-    
-    # Create a confirmation keyboard
-    keyboard = [
-        [
-            InlineKeyboardButton("Yes, delete my data", callback_data="confirm_delete"),
-            InlineKeyboardButton("No, keep my data", callback_data="cancel_delete")
-        ]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
     await update.message.reply_text(
         "⚠️ Are you sure you want to delete all your data?\n\n"
         "This will remove all your saved links, reminders, and usage statistics. "
         "This action cannot be undone.",
-        reply_markup=reply_markup
+        reply_markup=DELETE_CONFIRM_KEYBOARD
     )
 
+# Region and timezone pickers depend only on the static timezone config, so build them once
+REGION_KEYBOARD = InlineKeyboardMarkup(
+    [[InlineKeyboardButton(region, callback_data=f"region_{region}")] for region in REGIONS]
+)
+# Buttons carry the offset in whole minutes (the stored unit), so no float parsing on press
+TIMEZONE_KEYBOARDS = {
+    region: InlineKeyboardMarkup(
+        [[InlineKeyboardButton(timezone_name, callback_data=f"timezone_{round(offset * 60)}")]
+         for timezone_name, offset in timezones]
+    )
+    for region, timezones in REGION_TIMEZONES.items()
+}
+# Offset in minutes -> "+5.5"-style label for the confirmation message
+TIMEZONE_OFFSET_LABELS = {
+    round(offset * 60): f"+{float(offset)}" if offset >= 0 else str(float(offset))
+    for timezones in REGION_TIMEZONES.values()
+    for _, offset in timezones
+}
+
 async def set_timezone(update, context):
     """Handles the initial region selection step."""
-    regions = list(REGION_TIMEZONES.keys())  # Extract regions from the config
-    keyboard = [[InlineKeyboardButton(region, callback_data=f"region_{region}")] for region in regions]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
     await update.message.reply_text(
-        "Please select your region:", reply_markup=reply_markup
+        "Please select your region:", reply_markup=REGION_KEYBOARD
     )
 
 async def handle_region_selection(update, context):
@@ -173,62 +204,51 @@ async def handle_region_selection(update, context):
     await query.answer()
 
     # Extract selected region
-    selected_region = query.data.replace("region_", "")
+    selected_region = query.data.partition("_")[2]
     
-    # Get timezones for the selected region
-    if selected_region not in REGION_TIMEZONES:
+    # Get the timezone keyboard for the selected region
+    reply_markup = TIMEZONE_KEYBOARDS.get(selected_region)
+    if reply_markup is None:
         await query.edit_message_text("Invalid region selected. Please try again using /set_timezone")
         return
-
-    timezones = REGION_TIMEZONES[selected_region]
-    
-    # Create keyboard with timezone options
-    keyboard = []
-    for timezone_name, offset in timezones:
-        # Convert offset to string with sign
-        offset_str = f"+{offset}" if offset >= 0 else str(offset)
-        callback_data = f"timezone_{offset}"
-        keyboard.append([InlineKeyboardButton(timezone_name, callback_data=callback_data)])
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
     
     await query.edit_message_text(
         text=f"Selected region: {selected_region}\nPlease choose your timezone:",
         reply_markup=reply_markup
     )
 
+def _set_user_timezone(session, user_id, offset_minutes):
+    """Blocking part of handle_timezone_selection; returns False if there is no such user"""
+    user = get_user_by_telegram_id(session, user_id)
+    if not user:
+        return False
+    user.tz_offset_minutes = offset_minutes
+    user.has_set_timezone = True
+    session.commit()
+    user_cache.invalidate(user_id)
+    return True
+
 async def handle_timezone_selection(update, context):
     """Handles the timezone selection and saves it to the database."""
     query = update.callback_query
     await query.answer()
 
     try:
-        # Extract the selected timezone offset
-        selected_offset = float(query.data.replace("timezone_", ""))
+        # Extract the selected timezone offset (KeyError for anything not offered by the buttons)
+        offset_minutes = int(query.data.partition("_")[2])
+        offset_str = TIMEZONE_OFFSET_LABELS[offset_minutes]
         user_id = query.from_user.id
 
-        # Save timezone to database
-        db = DatabaseHandler()
-        session = db.get_session()
-        try:
-            user = session.query(User).filter_by(telegram_id=user_id).first()
-            if user:
-                user.timezone = str(selected_offset)  # Store as string for consistency
-                user.has_set_timezone = True
-                session.commit()
-                
-                # Format offset for display
-                offset_str = f"+{selected_offset}" if selected_offset >= 0 else str(selected_offset)
-                await query.edit_message_text(
-                    f"✅ Your timezone has been set to UTC{offset_str}.\n\n"
-                    "You can now send me links to save them!"
-                )
-            else:
-                await query.edit_message_text(
-                    "⚠️ Error: User not found. Please try again using /set_timezone"
-                )
-        finally:
-            session.close()
+        # Save timezone to database (in a worker thread, off the event loop)
+        if await db_handler.run_in_thread(_set_user_timezone, user_id, offset_minutes):
+            await query.edit_message_text(
+                f"✅ Your timezone has been set to UTC{offset_str}.\n\n"
+                "You can now send me links to save them!"
+            )
+        else:
+            await query.edit_message_text(
+                "⚠️ Error: User not found. Please try again using /set_timezone"
+            )
             
     except (ValueError, Exception) as e:
         logger.error(f"Error in timezone selection: {str(e)}")
@@ -236,27 +256,122 @@ async def handle_timezone_selection(update, context):
             "⚠️ Error setting timezone. Please try again using /set_timezone"
         )
 
-def get_user_local_time(utc_time, user_timezone_offset):
-    """Convert UTC time to user's local time"""
-    try:
-        offset = float(user_timezone_offset)
-        return utc_time + timedelta(hours=offset)
-    except (ValueError, TypeError):
-        return utc_time
+@lru_cache(maxsize=None)
+def _offset_delta(offset_minutes):
+    """timedelta for a UTC offset; there are only a few dozen distinct offsets"""
+    return timedelta(minutes=offset_minutes or 0)
 
-def get_utc_time(local_time, user_timezone_offset):
-    """Convert user's local time to UTC"""
-    try:
-        offset = float(user_timezone_offset)
-        return local_time - timedelta(hours=offset)
-    except (ValueError, TypeError):
-        return local_time
+def get_user_local_time(utc_time, offset_minutes):
+    """Convert UTC time to user's local time (offset_minutes may be None for UTC)"""
+    return utc_time + _offset_delta(offset_minutes)
+
+def get_utc_time(local_time, offset_minutes):
+    """Convert user's local time to UTC (offset_minutes may be None for UTC)"""
+    return local_time - _offset_delta(offset_minutes)
+
+# Built once; SQLAlchemy reuses its compiled form for every lookup
+_USER_BY_TELEGRAM_ID = select(User).where(User.telegram_id == bindparam('telegram_id'))
+
+def get_user_by_telegram_id(session, telegram_id):
+    """Look up a user by Telegram id via the unique telegram_id index"""
+    return session.scalars(_USER_BY_TELEGRAM_ID, {'telegram_id': telegram_id}).first()
+
+# Just the cached fields, without building a User object
+_USER_FIELDS_BY_TELEGRAM_ID = (
+    select(User.id, User.tz_offset_minutes, User.has_set_timezone)
+    .where(User.telegram_id == bindparam('telegram_id'))
+)
+
+def get_cached_user(session, telegram_id):
+    """CachedUser for read-only use, from user_cache or the database; None if there is no such user"""
+    cached = user_cache.get(telegram_id)
+    if cached is None:
+        row = session.execute(_USER_FIELDS_BY_TELEGRAM_ID, {'telegram_id': telegram_id}).first()
+        if row is None:
+            return None
+        cached = user_cache.set(telegram_id, row)
+    return cached
+
+# Reminder button commands -> days from today
+REMINDER_DAYS = {
+    "tomorrow": 1,
+    "2days": 2,
+    "3days": 3
+}
+
+# Callback query patterns, compiled once at import
+REGION_CALLBACK_PATTERN = re.compile(r"^region_")
+TIMEZONE_CALLBACK_PATTERN = re.compile(r"^timezone_")
+DELETE_CALLBACK_PATTERN = re.compile(r"^confirm_delete|cancel_delete$")
+LIST_CALLBACK_PATTERN = re.compile(r"^list_")
+SNOOZE_CALLBACK_PATTERN = re.compile(r"^snooze_")
+# Reminder time buttons, e.g. "2days_42"
+REMINDER_CALLBACK_PATTERN = re.compile(r"^(tomorrow|2days|3days|skip)_\d+$")
+
+# (label, command) rows of the keyboard shown after saving a link
+REMINDER_BUTTON_ROWS = (
+    (("Tomorrow", "tomorrow"), ("In 2 Days", "2days")),
+    (("In 3 Days", "3days"), ("Skip", "skip")),
+)
+
+def reminder_keyboard(reminder_id):
+    """Reminder time keyboard for a saved link; only the callback ids vary"""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(label, callback_data=f"{command}_{reminder_id}") for label, command in row]
+        for row in REMINDER_BUTTON_ROWS
+    ])
+
+def snooze_keyboard(reminder_id):
+    """Single snooze button attached to a sent reminder"""
+    return InlineKeyboardMarkup([[
+        InlineKeyboardButton("Remind me tomorrow", callback_data=f"snooze_{reminder_id}")
+    ]])
+
+@lru_cache(maxsize=256)
+def default_reminder_time(local_date, offset_minutes, days=1):
+    """UTC time of 9 AM local, days after local_date, cached per day, offset and days"""
+    local_reminder_time = datetime.combine(
+        local_date + timedelta(days=days), time(hour=9), tzinfo=timezone.utc
+    )
+    return get_utc_time(local_reminder_time, offset_minutes)
+
+def next_reminder_time(now, offset_minutes, days=1):
+    """UTC time of 9 AM in the user's timezone, days after their current local date"""
+    local_date = get_user_local_time(now, offset_minutes).date()
+    return default_reminder_time(local_date, offset_minutes, days)
 
 # In bot.py
 
 # Update the import
 from utils.url_extractor import extract_urls
 
+def _delete_user_data(session, user_id):
+    """Blocking part of handle_delete_confirmation; returns False if there is no such user"""
+    user = get_user_by_telegram_id(session, user_id)
+    if not user:
+        return False
+
+    # Two bulk DELETEs instead of loading every link for the ORM cascade;
+    # reminders go first since their FK has no ON DELETE CASCADE
+    user_link_ids = select(Link.id).where(Link.user_id == user.id)
+    session.execute(
+        delete(Reminder)
+        .where(Reminder.link_id.in_(user_link_ids))
+        .execution_options(synchronize_session=False)
+    )
+    session.execute(
+        delete(Link)
+        .where(Link.user_id == user.id)
+        .execution_options(synchronize_session=False)
+    )
+
+    # Keep the user record but reset preferences
+    user.tz_offset_minutes = None
+    user.has_set_timezone = False
+    session.commit()
+    user_cache.invalidate(user_id)
+    return True
+
 async def handle_delete_confirmation(update, context):
     """Handle delete data confirmation"""
     query = update.callback_query
@@ -270,29 +385,13 @@ async def handle_delete_confirmation(update, context):
     
     # User confirmed deletion
     user_id = query.from_user.id
-    db = DatabaseHandler()
-    session = None
     
     try:
-        session = db.get_session()
-        
-        # Find the user
-        user = session.query(User).filter_by(telegram_id=user_id).first()
-        if not user:
+        # The deletes run in a worker thread so the event loop keeps serving updates
+        if not await db_handler.run_in_thread(_delete_user_data, user_id):
             await query.edit_message_text("No data found to delete.")
             return
         
-        # FIXED: Get links and delete each one through the ORM to trigger cascades
-        links = session.query(Link).filter_by(user_id=user.id).all()
-        for link in links:
-            session.delete(link)  # This triggers the cascade delete of reminders
-        
-        # Keep the user record but reset preferences
-        user.timezone = None
-        user.has_set_timezone = False
-        
-        session.commit()
-        
         await query.edit_message_text(
             "✅ All your data has been deleted. Your saved links and reminders "
             "have been removed from our database."
@@ -300,99 +399,110 @@ async def handle_delete_confirmation(update, context):
         
     except Exception as e:
         logger.error(f"Error deleting user data: {str(e)}")
-        if session:
-            session.rollback()
         await query.edit_message_text(
             "Sorry, there was an error deleting your data. Please try again later."
         )
-    finally:
-        if session:
-            session.close()
+
+LINKS_PAGE_SIZE = 5
+
+def fetch_links_page(session, user_id, page, page_size=LINKS_PAGE_SIZE):
+    """
+    Return (links, total_links, page) for one page of a user's links, newest first.
+    links are (id, url, total) rows rather than Link objects, since the list only shows URLs.
+    The total comes from a window count on the same query; page is clamped to the valid range.
+    """
+    def fetch(page):
+        return session.execute(
+            select(Link.id, Link.url, func.count().over().label('total'))
+            .where(Link.user_id == user_id)
+            .order_by(Link.created_at.desc())
+            .limit(page_size)
+            .offset((page - 1) * page_size)
+        ).all()
+
+    page = max(page, 1)
+    rows = fetch(page)
+    if not rows and page > 1:
+        # Past the last page there are no rows to carry the count, so count once and show the last page
+        total_links = session.scalar(
+            select(func.count()).select_from(Link).where(Link.user_id == user_id)
+        )
+        page = max((total_links + page_size - 1) // page_size, 1)
+        rows = fetch(page) if total_links else []
+
+    total_links = rows[0].total if rows else 0
+    return rows, total_links, page
 
 async def list_links(update, context):
     """Command to list saved links with inline button pagination"""
-    # Handle both direct commands and callbacks
-    is_callback = hasattr(update, 'callback_query') and update.callback_query
+    # Get page from command args
+    page = 1
+    if context.args and context.args[0].isdigit():
+        page = int(context.args[0])
     
-    if is_callback:
+    await show_links_page(update.message, context, page)
+
+async def handle_list_pagination(update, context):
+    """Handle pagination callbacks for the list command"""
+    try:
         query = update.callback_query
-        # Check if query is None before using
-        if query:
-            await query.answer()
-            message = query.message
-            user_id = query.from_user.id
-            
-            # Extract page number from callback data
-            parts = query.data.split('_')
-            page = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 1
-        else:
-            logger.error("Callback query is None")
-            return
-    else:
-        message = update.message
-        user_id = update.message.from_user.id
+        await query.answer()  # Acknowledge the callback
+        
+        # Extract page number from callback data
+        page = query.data.partition('_')[2]
+        page = int(page) if page.isdigit() else 1
         
-        # Get page from command args
-        page = 1
-        if context.args and context.args[0].isdigit():
-            page = int(context.args[0])
+        await show_links_page(query, context, page, is_callback=True)
+                
+    except Exception as e:
+        logger.error(f"Error handling pagination callback: {str(e)}")
+
+def _load_links_page(session, telegram_id, page, page_size):
+    """Get the user, then the links for the page and the total count in one query"""
+    user = get_cached_user(session, telegram_id)
+    if not user:
+        return [], 0, page
+    return fetch_links_page(session, user.id, page, page_size)
+
+async def show_links_page(message_or_query, context, page, is_callback=False):
+    """Show a page of the user's links, editing the message in place for callbacks"""
+    async def respond(text, reply_markup=None):
+        if is_callback:
+            await message_or_query.edit_message_text(
+                text,
+                reply_markup=reply_markup,
+                disable_web_page_preview=True
+            )
+        else:
+            await message_or_query.reply_text(
+                text,
+                reply_markup=reply_markup,
+                disable_web_page_preview=True
+            )
     
-    page_size = 5
-    db = DatabaseHandler()
-    session = None
+    user_id = message_or_query.from_user.id
+    page_size = LINKS_PAGE_SIZE
+    db = db_handler
     
     try:
-        session = db.get_session()
-        
-        # Get user
-        user = session.query(User).filter_by(telegram_id=user_id).first()
-        if not user:
-            text = "You don't have any saved links yet."
-            if is_callback:
-                await query.edit_message_text(text)
-            else:
-                await message.reply_text(text)
-            return
-            
-        # Count total links
-        total_links = session.query(Link).filter_by(user_id=user.id).count()
+        # Queries run in a worker thread so the event loop keeps serving updates
+        links, total_links, page = await db.run_in_thread(
+            _load_links_page, user_id, page, page_size
+        )
         
         if total_links == 0:
-            text = "You don't have any saved links yet."
-            if is_callback:
-                await query.edit_message_text(text)
-            else:
-                await message.reply_text(text)
+            await respond("You don't have any saved links yet.")
             return
             
         # Calculate total pages
         total_pages = (total_links + page_size - 1) // page_size
-        
-        # Adjust page if out of bounds
-        if page > total_pages:
-            page = total_pages
-        if page < 1:
-            page = 1
-            
-        # Calculate offset
         offset = (page - 1) * page_size
         
-        # Get links for current page
-        links = (
-            session.query(Link)
-            .filter_by(user_id=user.id)
-            .order_by(Link.created_at.desc())
-            .limit(page_size)
-            .offset(offset)
-            .all()
+        # Format the message in one join rather than growing a string per link
+        message_text = f"📋 Your Saved Links (Page {page}/{total_pages})\n\n" + "".join(
+            f"{i}. {link.url}\n\n" for i, link in enumerate(links, offset + 1)
         )
         
-        # Format the message
-        message_text = f"📋 Your Saved Links (Page {page}/{total_pages})\n\n"
-        
-        for i, link in enumerate(links, offset + 1):
-            message_text += f"{i}. {link.url}\n\n"
-        
         # Create inline keyboard for navigation
         keyboard = []
         nav_buttons = []
@@ -412,298 +522,22 @@ async def list_links(update, context):
             
         reply_markup = InlineKeyboardMarkup(keyboard) if keyboard else None
         
-        # Send or edit message
-        if is_callback:
-            await query.edit_message_text(
-                message_text,
-                reply_markup=reply_markup,
-                disable_web_page_preview=True
-            )
-        else:
-            await message.reply_text(
-                message_text,
-                reply_markup=reply_markup,
-                disable_web_page_preview=True
-            )
-            
-    except Exception as e:
-        logger.error(f"Error in list_links: {str(e)}")
-        error_message = "Sorry, I encountered a problem while retrieving your links."
-        
-        if is_callback:
-            try:
-                await query.edit_message_text(error_message)
-            except Exception as edit_err:
-                logger.error(f"Failed to edit message: {edit_err}")
-        else:
-            await message.reply_text(error_message)
-    finally:
-        if session:
-            session.close()
-
-async def handle_list_pagination(update, context):
-    """Handle pagination callbacks for the list command"""
-    try:
-        query = update.callback_query
-        await query.answer()  # Acknowledge the callback
-        
-        # Extract page number from callback data
-        parts = query.data.split('_')
-        page = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 1
-        
-        user_id = query.from_user.id
-        db = DatabaseHandler()
-        session = None
-        
-        try:
-            session = db.get_session()
-            
-            # Get user
-            user = session.query(User).filter_by(telegram_id=user_id).first()
-            if not user:
-                await query.edit_message_text("You don't have any saved links yet.")
-                return
-                
-            # Count total links
-            total_links = session.query(Link).filter_by(user_id=user.id).count()
-            
-            if total_links == 0:
-                await query.edit_message_text("You don't have any saved links yet.")
-                return
-                
-            # Calculate total pages
-            page_size = 5
-            total_pages = (total_links + page_size - 1) // page_size
-            
-            # Adjust page if out of bounds
-            if page > total_pages:
-                page = total_pages
-            if page < 1:
-                page = 1
-                
-            # Calculate offset
-            offset = (page - 1) * page_size
-            
-            # Get links for current page
-            links = (
-                session.query(Link)
-                .filter_by(user_id=user.id)
-                .order_by(Link.created_at.desc())
-                .limit(page_size)
-                .offset(offset)
-                .all()
-            )
-            
-            # Format the message
-            message_text = f"📋 Your Saved Links (Page {page}/{total_pages})\n\n"
-            
-            for i, link in enumerate(links, offset + 1):
-                message_text += f"{i}. {link.url}\n\n"
-            
-            # Create inline keyboard for navigation
-            keyboard = []
-            nav_buttons = []
-            
-            if page > 1:
-                nav_buttons.append(
-                    InlineKeyboardButton("◀️ Previous", callback_data=f"list_{page-1}")
-                )
-                
-            if page < total_pages:
-                nav_buttons.append(
-                    InlineKeyboardButton("Next ▶️", callback_data=f"list_{page+1}")
-                )
-                
-            if nav_buttons:
-                keyboard.append(nav_buttons)
-                
-            reply_markup = InlineKeyboardMarkup(keyboard) if keyboard else None
-            
-            # Edit message
-            await query.edit_message_text(
-                message_text,
-                reply_markup=reply_markup,
-                disable_web_page_preview=True
-            )
-                
-        except Exception as e:
-            logger.error(f"Error in pagination: {str(e)}")
-            await query.edit_message_text(
-                "Sorry, I encountered a problem while retrieving your links."
-            )
-        finally:
-            if session:
-                session.close()
-                
-    except Exception as e:
-        logger.error(f"Error handling pagination callback: {str(e)}")
-
-
-
-async def show_links_page(message_or_query, context, page, is_callback=False):
-    """Show a specific page of links with no formatting to ensure compatibility"""
-    logger.info(f"Starting show_links_page with page={page}, is_callback={is_callback}")
-    
-    try:
-        if is_callback:
-            user_id = message_or_query.from_user.id
-        else:
-            user_id = message_or_query.from_user.id
-        
-        # Set page size
-        page_size = 5
-        
-        db = DatabaseHandler()
-        session = None
-        
-        try:
-            session = db.get_session()
-            
-            # Get user
-            user = session.query(User).filter_by(telegram_id=user_id).first()
-            if not user:
-                message_text = (
-                    "You don't have any saved links yet.\n"
-                    "Send me any link to save it for later reading!"
-                )
-                
-                if is_callback:
-                    await message_or_query.edit_message_text(message_text)
-                else:
-                    await message_or_query.reply_text(message_text)
-                return
-                
-            # Count total links
-            total_links = session.query(Link).filter_by(user_id=user.id).count()
-            
-            if total_links == 0:
-                message_text = (
-                    "You don't have any saved links yet.\n"
-                    "Send me any link to save it for later reading!"
-                )
-                
-                if is_callback:
-                    await message_or_query.edit_message_text(message_text)
-                else:
-                    await message_or_query.reply_text(message_text)
-                return
-                
-            # Calculate total pages
-            total_pages = (total_links + page_size - 1) // page_size
-            
-            # Adjust page if out of bounds
-            if page > total_pages:
-                page = total_pages
-                
-            # Calculate offset for query
-            offset = (page - 1) * page_size
-            
-            # Get links for current page
-            links = (
-                session.query(Link)
-                .filter_by(user_id=user.id)
-                .order_by(Link.created_at.desc())
-                .limit(page_size)
-                .offset(offset)
-                .all()
-            )
-            
-            # Format the message with NO special formatting
-            header = f"📋 Your Saved Links (Page {page}/{total_pages})\n\n"
-            message_parts = [header]
-            
-            for i, link in enumerate(links, offset + 1):
-                # Format creation date
-                created_date = link.created_at.strftime("%b %d, %Y")
-                
-                # Determine read status emoji
-                status_emoji = "✅" if link.is_read else "📖"
-                
-                # Get active reminder if any
-                active_reminder = (
-                    session.query(Reminder)
-                    .filter_by(link_id=link.id, status='pending')
-                    .first()
-                )
-                
-                reminder_info = ""
-                if active_reminder:
-                    # Format reminder time in user's timezone
-                    local_time = get_user_local_time(
-                        active_reminder.remind_at, 
-                        user.timezone
-                    )
-                    reminder_date = local_time.strftime("%b %d at %I:%M %p")
-                    reminder_info = f"⏰ Reminder: {reminder_date}\n"
-                
-                # Format link entry - with NO special characters
-                link_text = link.title if link.title else link.url
-                # Limit text length
-                if len(link_text) > 40:
-                    link_text = link_text[:37] + "..."
-                
-                link_entry = (
-                    f"{i}. {status_emoji} {link_text}\n"
-                    f"🔗 {link.url}\n"
-                    f"📅 Saved: {created_date}\n"
-                    f"{reminder_info}\n"
-                )
-                
-                message_parts.append(link_entry)
-            
-            # Create navigation buttons
-            keyboard = []
-            nav_buttons = []
-            
-            if page > 1:
-                nav_buttons.append(
-                    InlineKeyboardButton("◀️ Previous", callback_data=f"page_{page-1}")
-                )
-                
-            if page < total_pages:
-                nav_buttons.append(
-                    InlineKeyboardButton("Next ▶️", callback_data=f"page_{page+1}")
-                )
-                
-            if nav_buttons:
-                keyboard.append(nav_buttons)
-                
-            reply_markup = InlineKeyboardMarkup(keyboard) if keyboard else None
-            message_text = "\n".join(message_parts)
+        await respond(message_text, reply_markup)
             
-            # Send or edit message based on context
-            if is_callback:
-                await message_or_query.edit_message_text(
-                    message_text,
-                    reply_markup=reply_markup,
-                    disable_web_page_preview=True
-                )
-            else:
-                await message_or_query.reply_text(
-                    message_text,
-                    reply_markup=reply_markup,
-                    disable_web_page_preview=True
-                )
-                
-        except Exception as e:
-            logger.error(f"Database operation error: {str(e)}")
-            raise
-        finally:
-            if session:
-                session.close()
-                
     except Exception as e:
         logger.error(f"Error in show_links_page: {str(e)}")
-        error_message = "Sorry, I encountered a problem while retrieving your links. Please try again later."
-        
         try:
-            if is_callback:
-                await message_or_query.edit_message_text(error_message)
-            else:
-                await message_or_query.reply_text(error_message)
+            await respond("Sorry, I encountered a problem while retrieving your links.")
         except Exception as send_err:
             logger.error(f"Failed to send error message: {str(send_err)}")
 
+def _count_user_links(session, user_id):
+    """Blocking part of list_links_minimal; returns the link count, or None if there is no such user"""
+    user = get_cached_user(session, user_id)
+    if not user:
+        return None
+    return session.query(Link).filter_by(user_id=user.id).count()
+
 async def list_links_minimal(update, context):
     """Ultra-minimal implementation of list links"""
     user_id = update.message.from_user.id
@@ -712,23 +546,17 @@ async def list_links_minimal(update, context):
         # Just send a simple message first to check basic functionality
         await update.message.reply_text("Checking your saved links...")
         
-        # Try to access the database
-        db = DatabaseHandler()
-        with db.session_scope() as session:
-            # Get user
-            user = session.query(User).filter_by(telegram_id=user_id).first()
-            if not user:
-                await update.message.reply_text("You don't have any saved links yet.")
-                return
-                
-            # Count links only
-            link_count = session.query(Link).filter_by(user_id=user.id).count()
-            
-            # Send minimal response
-            await update.message.reply_text(
-                f"You have {link_count} saved links.\n\n"
-                "Use /list 1 to see the first page."
-            )
+        # Count links only (in a worker thread, off the event loop)
+        link_count = await db_handler.run_in_thread(_count_user_links, user_id)
+        if link_count is None:
+            await update.message.reply_text("You don't have any saved links yet.")
+            return
+        
+        # Send minimal response
+        await update.message.reply_text(
+            f"You have {link_count} saved links.\n\n"
+            "Use /list 1 to see the first page."
+        )
             
     except Exception as e:
         # Log the full exception details
@@ -762,26 +590,39 @@ async def handle_message(update, context):
 
         # Process valid URLs
         try:
-            saved_count = await save_link_logic(update, context, valid_urls)
-            logger.info(f"Saved {saved_count} links for user {user_id}")
+            saved, failed_urls = await save_link_logic(update, context, valid_urls)
+            logger.info(f"Saved {len(saved)} links for user {user_id}")
         except Exception as e:
             logger.error(f"Failed to save links: {str(e)}")
             await update.message.reply_text(
                 "Sorry, I encountered an error while saving your links. Please try again later."
             )
+            return
 
-    # Handle validation errors
-    if error_messages:
+        error_messages = [f"Failed to save link: {url}" for url in failed_urls] + error_messages
         error_text = "\n".join(f"❌ {error}" for error in error_messages)
-        if valid_urls:
-            await update.message.reply_text(
-                "Some URLs couldn't be saved:\n" + error_text
-            )
-        else:
+
+        # One message per saved link (each has its own reminder buttons);
+        # errors ride along on the last one instead of costing another request
+        # Sent one after another so they arrive in URL order with the errors last
+        for index, (url, reminder_id) in enumerate(saved, start=1):
+            text = f"Link saved: {url}"
+            if error_messages and index == len(saved):
+                text += "\n\nSome URLs couldn't be saved:\n" + error_text
             await update.message.reply_text(
-                "Unable to save URLs:\n" + error_text
+                text,
+                reply_markup=reminder_keyboard(reminder_id)
             )
-    elif not valid_urls:
+        if not saved:
+            await update.message.reply_text("Unable to save URLs:\n" + error_text)
+
+    # Handle validation errors
+    elif error_messages:
+        error_text = "\n".join(f"❌ {error}" for error in error_messages)
+        await update.message.reply_text(
+            "Unable to save URLs:\n" + error_text
+        )
+    else:
         await update.message.reply_text(
             "Please send me a link to save it for later! 🔍\n"
             "The link should start with http:// or https://"
@@ -789,316 +630,364 @@ async def handle_message(update, context):
         
 # Placeholder function to simulate logging user actions
 def log_invalid_input(user_id, message_text):
-    """Simulates logging an invalid input action for now."""
-    # This is a mock log entry to show what would be logged
-    mock_log_entry = {
-        "user_id": user_id,
-        "action_type": "invalid_input",
-        "action_data": {"message_text": message_text},
-        "created_at": datetime.now(timezone.utc)  # Use timezone-aware UTC datetime
-    }
-    print("Logged action:", mock_log_entry)
-
-async def save_link_logic(update, context, urls):
-    """Enhanced save_link_logic with better error handling"""
-    db = DatabaseHandler()
-    session = None
-    try:
-        session = db.get_session()
-        
-        user_id = update.message.from_user.id
-        username = update.message.from_user.username
-        first_name = update.message.from_user.first_name
-        
-        logger.info(f"Attempting to save links for user {user_id}")
-        
-        user = session.query(User).filter_by(telegram_id=user_id).first()
-        if not user:
-            logger.info(f"Creating new user with telegram_id {user_id}")
-            user = User(
-                telegram_id=user_id,
-                username=username,
-                first_name=first_name
-            )
-            session.add(user)
-            session.commit()
-
-        saved_count = 0
-        for url in urls:
-            try:
-                link = Link(
-                    user_id=user.id,
-                    url=url
-                )
-                session.add(link)
-                session.flush()  # Get the link ID without committing
-
-                user_timezone = user.timezone if user else None
-                now = datetime.now(timezone.utc)
-                local_reminder_time = get_user_local_time(now, user_timezone).replace(
-                    hour=9, minute=0, second=0, microsecond=0
-                ) + timedelta(days=1)
-                utc_reminder_time = get_utc_time(local_reminder_time, user_timezone)
-                
-                reminder = Reminder(
-                    link_id=link.id,
-                    remind_at=utc_reminder_time,
-                    is_default_time=True
-                )
-                session.add(reminder)
-                session.flush()
+    """Log an invalid input action (formatted only if INFO is enabled)"""
+    logger.info("invalid_input user=%s text=%s", user_id, message_text)
+
+def _save_links(session, from_user, urls):
+    """Blocking part of save_link_logic; returns (user id, saved, failed_urls)"""
+    user_id = from_user.id
+    username = from_user.username
+    first_name = from_user.first_name
+    
+    logger.info(f"Attempting to save links for user {user_id}")
+    
+    user = get_cached_user(session, user_id)
+    if not user:
+        logger.info(f"Creating new user with telegram_id {user_id}")
+        # Updates run concurrently, so /start may be creating this user too
+        new_user, _ = get_or_create_user(session, user_id, username, first_name)
+        session.commit()
+        user = user_cache.set(user_id, new_user)
 
-                # Update analytics
-                db.update_user_analytics(user.id, 'link_saved', session=session)
-                db.update_user_analytics(user.id, 'default_passive', session=session)
+    # The default reminder time is the same for every link in the message
+    utc_reminder_time = next_reminder_time(datetime.now(timezone.utc), user.tz_offset_minutes)
 
-                saved_count += 1
-                
-                # Log link save with total count
-                total_links = session.query(Link).filter_by(user_id=user.id).count()
-                logger.info(f"[USER_ACTIVITY] User @{username or user_id} saved link. Total links: {total_links}")
-                
-                # Create reminder setting keyboard
-                keyboard = [
-                    [
-                        InlineKeyboardButton("Tomorrow", callback_data=f"tomorrow_{reminder.id}"),
-                        InlineKeyboardButton("In 2 Days", callback_data=f"2days_{reminder.id}")
-                    ],
-                    [
-                        InlineKeyboardButton("In 3 Days", callback_data=f"3days_{reminder.id}"),
-                        InlineKeyboardButton("Skip", callback_data=f"skip_{reminder.id}")
-                    ]
-                ]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-
-                await update.message.reply_text(
-                    f"Link saved: {url}",
-                    reply_markup=reply_markup
-                )
+    links = []
+    failed_urls = []
+    for url in urls:
+        try:
+            links.append(Link(user_id=user.id, url=url))
+        except ValueError as e:
+            logger.error(f"Error saving specific link {url}: {str(e)}")
+            failed_urls.append(url)
+
+    saved_count = len(links)
+    reminders = []
+    if links:
+        # One flush per table instead of two per link
+        session.add_all(links)
+        session.flush()  # Get the link IDs without committing
+        reminders = [
+            Reminder(link_id=link.id, remind_at=utc_reminder_time, is_default_time=True)
+            for link in links
+        ]
+        session.add_all(reminders)
+        session.commit()
 
-            except Exception as e:
-                logger.error(f"Error saving specific link {url}: {str(e)}")
-                await update.message.reply_text(f"Failed to save link: {url}")
-                continue
+        # Log link save (no COUNT over all of the user's links on this hot path)
+        logger.info(f"[USER_ACTIVITY] User @{username or user_id} saved {saved_count} link(s)")
 
-        session.commit()
-        return saved_count
+    saved = [(link.url, reminder.id) for link, reminder in zip(links, reminders)]
+    return user.id, saved, failed_urls
 
+async def save_link_logic(update, context, urls):
+    """Save links with default reminders; returns ([(url, reminder_id)], failed_urls) for the caller to reply"""
+    # The database work is synchronous, so keep it off the event loop
+    try:
+        db_user_id, saved, failed_urls = await db_handler.run_in_thread(
+            _save_links, update.message.from_user, urls
+        )
     except Exception as e:
         logger.error(f"Error in save_link_logic: {str(e)}")
-        if session:
-            session.rollback()
         raise
-    finally:
-        if session:
-            session.close()
+    if saved:
+        # Update analytics (written in batches by the analytics flush job)
+        analytics_buffer.record(db_user_id, 'link_saved', len(saved))
+        analytics_buffer.record(db_user_id, 'default_passive', len(saved))
+    return saved, failed_urls
 
 
+# Loader options for the reminder buttons, which need the reminder's user
+REMINDER_WITH_USER = (joinedload(Reminder.link).joinedload(Link.user),)
+
+def _reschedule_reminder(session, reminder_id, days, is_default_time):
+    """Move a reminder to 9 AM local time, days ahead; returns (user, remind_at, offset) or None if it's gone"""
+    # The link and its user are joined into the same query
+    reminder = session.get(Reminder, reminder_id, options=REMINDER_WITH_USER)
+    if not reminder:
+        return None
+
+    # Get user's timezone
+    user = reminder.link.user
+    user_timezone = user.tz_offset_minutes
+
+    # Use UTC time as base
+    remind_at = next_reminder_time(datetime.now(timezone.utc), user_timezone, days)
+    reminder.remind_at = remind_at
+    reminder.is_default_time = is_default_time
+    return user, remind_at, user_timezone
+
 async def handle_reminder_callback(update: Update, context: CallbackContext):
     query = update.callback_query
     await query.answer()
-    session = None
     
     try:
-        # Get callback data
+        # Get callback data (the handler pattern only lets reminder buttons through)
         callback_data = query.data
-        
-        # Skip if this is a timezone-related callback
-        if callback_data.startswith(('region_', 'timezone_')):
-            return
             
         # Parse the command and reminder_id
-        command, reminder_id = callback_data.split("_")
+        command, _, reminder_id = callback_data.partition("_")
         reminder_id = int(reminder_id)
 
-        db = DatabaseHandler()
-        session = db.get_session()
+        # Skip falls back to the default: 9 AM tomorrow in the user's timezone
+        is_skip = command == "skip"
+        days = 1 if is_skip else REMINDER_DAYS.get(command)
+        if days is None:
+            return
 
-        # Get the reminder
-        reminder = session.query(Reminder).filter_by(id=reminder_id).first()
-        if not reminder:
+        # The update runs in a worker thread so the event loop keeps serving updates
+        result = await db_handler.run_in_thread(
+            _reschedule_reminder, reminder_id, days, is_skip
+        )
+        if result is None:
             logger.warning(f"Reminder {reminder_id} not found")
             return
+        user, utc_remind_time, user_timezone = result
 
-        # Get user's timezone
-        user = session.query(User).filter_by(telegram_id=query.from_user.id).first()
-        user_timezone = user.timezone if user else None
-        
-        # Use UTC time as base
-        now = datetime.now(timezone.utc)
-
-        if command == "skip":
-            db.update_user_analytics(user.id, 'active_skip', session=session)
-            # Convert to user's local time, set to 9 AM, then convert back to UTC
-            local_time = get_user_local_time(now, user_timezone)
-            local_next_day = local_time.replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=1)
-            utc_next_day = get_utc_time(local_next_day, user_timezone)
-            
-            reminder.remind_at = utc_next_day
-            reminder.is_default_time = True
-            session.commit()
+        if is_skip:
+            analytics_buffer.record(user.id, 'active_skip')
+            analytics_buffer.record(user.id, 'default_reminder')
             # Just remove the keyboard
             await query.edit_message_reply_markup(None)
-            db.update_user_analytics(user.id, 'default_reminder', session=session)
-            
         else:
-            # Calculate days based on command
-            days_map = {
-                "tomorrow": 1,
-                "2days": 2,
-                "3days": 3
-            }
+            analytics_buffer.record(user.id, 'manual_reminder')
+            analytics_buffer.record(user.id, 'default_reminder_removed')  # Decrement default count
             
-            if command in days_map:
-                days = days_map[command]
-                # Convert to user's local time, set to 9 AM, then convert back to UTC
-                local_time = get_user_local_time(now, user_timezone)
-                local_remind_time = local_time.replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=days)
-                utc_remind_time = get_utc_time(local_remind_time, user_timezone)
-                
-                reminder.remind_at = utc_remind_time
-                reminder.is_default_time = False
-                session.commit()
-                
-                # Send confirmation using user's local time
-                db.update_user_analytics(user.id, 'manual_reminder', session=session)
-                db.update_user_analytics(user.id, 'default_reminder_removed', session=session)  # Decrement default count
-                formatted_date = get_user_local_time(utc_remind_time, user_timezone).strftime("%B %d at 9:00 AM")
-                await query.edit_message_text(f"✅ Reminder set for {formatted_date}")
+            # Send confirmation using user's local time
+            formatted_date = get_user_local_time(utc_remind_time, user_timezone).strftime("%B %d at 9:00 AM")
+            await query.edit_message_text(f"✅ Reminder set for {formatted_date}")
 
     except Exception as e:
         logger.error(f"Error in reminder callback: {str(e)}")
-        if session:
-            session.rollback()
-    finally:
-        if session:
-            session.close()
+
+# Seconds between analytics batch writes
+ANALYTICS_FLUSH_INTERVAL = 2
+
+# Most reminders handled per scheduler run; the rest are picked up next run
+REMINDER_BATCH_SIZE = 500
+# Reminder messages in flight at once, below Telegram's ~30 messages/second bot limit
+REMINDER_SEND_CONCURRENCY = 25
+
+async def _send_reminder(bot, row, semaphore):
+    """Send one reminder message; returns whether it was delivered"""
+    async with semaphore:
+        try:
+            await bot.send_message(
+                chat_id=row.telegram_id,
+                text=f"🔔 Time to read: {row.url}",
+                reply_markup=snooze_keyboard(row.id)
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send reminder {row.id}: {str(e)}")
+            return False
+
+def _fetch_due_reminders(session, current_utc):
+    """Due reminders as (id, url, telegram_id, user_id) rows"""
+    # Only the columns the message needs; no ORM objects are loaded
+    return session.execute(
+        select(Reminder.id, Link.url, User.telegram_id, User.id.label('user_id'))
+        .join(Link, Reminder.link_id == Link.id)
+        .join(User, Link.user_id == User.id)
+        .where(
+            Reminder.status == 'pending',
+            Reminder.remind_at <= current_utc
+        )
+        .order_by(Reminder.remind_at)
+        .limit(REMINDER_BATCH_SIZE)
+    ).all()
+
+def _mark_reminders_sent(session, reminder_ids, current_utc):
+    """Flag delivered reminders as sent in one UPDATE"""
+    session.execute(
+        update(Reminder)
+        .where(Reminder.id.in_(reminder_ids))
+        .values(status='sent', last_reminded_at=current_utc)
+        .execution_options(synchronize_session=False)
+    )
+
+def _postpone_reminders(session, reminder_ids, retry_at):
+    """Move undelivered reminders to retry_at in one UPDATE"""
+    session.execute(
+        update(Reminder)
+        .where(Reminder.id.in_(reminder_ids))
+        .values(remind_at=retry_at)
+        .execution_options(synchronize_session=False)
+    )
 
 async def send_due_reminders(bot, db_handler):
     """Find and send due reminders."""
-    session = None
     try:
-        session = db_handler.get_session()
         current_utc = datetime.now(timezone.utc)
-        
-        due_reminders = (
-            session.query(Reminder)
-            .join(Link)
-            .join(User)
-            .filter(
-                Reminder.status == 'pending',
-                Reminder.remind_at <= current_utc
-            )
-            .all()
-        )
+        # Queries run in a worker thread so the event loop keeps serving updates
+        due_reminders = await db_handler.run_in_thread(_fetch_due_reminders, current_utc)
         
         if due_reminders:
             logger.info(f"Found {len(due_reminders)} due reminders")
             
-            for reminder in due_reminders:
-                try:
-                    keyboard = [[InlineKeyboardButton(
-                        "Remind me tomorrow", 
-                        callback_data=f"snooze_{reminder.id}"
-                    )]]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    
-                    await bot.send_message(
-                        chat_id=reminder.link.user.telegram_id,
-                        text=f"🔔 Time to read: {reminder.link.url}",
-                        reply_markup=reply_markup
-                    )
-                    
-                    reminder.status = 'sent'
-                    reminder.last_reminded_at = current_utc
-                    logger.info(f"Sent reminder {reminder.id} to user {reminder.link.user.telegram_id}")
-                    reminder.status = 'sent'
-                    db_handler.update_user_analytics(reminder.link.user.id, 'reminder_completed', session=session)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to send reminder {reminder.id}: {str(e)}")
-                    continue
+            # Send concurrently, then mark the delivered ones in one UPDATE
+            semaphore = asyncio.Semaphore(REMINDER_SEND_CONCURRENCY)
+            delivered = await asyncio.gather(
+                *(_send_reminder(bot, row, semaphore) for row in due_reminders)
+            )
+            
+            sent_rows = [row for row, was_sent in zip(due_reminders, delivered) if was_sent]
+            for row in sent_rows:
+                logger.info(f"Sent reminder {row.id} to user {row.telegram_id}")
             
-            session.commit()
+            if sent_rows:
+                await db_handler.run_in_thread(
+                    _mark_reminders_sent, [row.id for row in sent_rows], current_utc
+                )
+            for row in sent_rows:
+                analytics_buffer.record(row.user_id, 'reminder_completed')
+            
+            # Retry failed sends (e.g. the user blocked the bot) one check interval later
+            # instead of leaving them due, which would wake the scheduler right away
+            failed_ids = [row.id for row, was_sent in zip(due_reminders, delivered) if not was_sent]
+            if failed_ids:
+                retry_at = current_utc + timedelta(seconds=config.REMINDER_CHECK_INTERVAL)
+                await db_handler.run_in_thread(_postpone_reminders, failed_ids, retry_at)
+                logger.warning(f"Postponed {len(failed_ids)} undelivered reminders until {retry_at}")
         
     except Exception as e:
         logger.error(f"Error processing reminders: {str(e)}")
-        if session:
-            session.rollback()
-    finally:
-        if session:
-            session.close()
+
+# Shortest wait between reminder checks; the longest is config.REMINDER_CHECK_INTERVAL,
+# which also picks up reminders saved since the last check that are due before the scheduled one
+REMINDER_CHECK_MIN_DELAY = 5
+
+def _next_due_time(session):
+    """remind_at of the earliest pending reminder, or None (served by idx_reminders_pending_due)"""
+    return session.scalar(select(func.min(Reminder.remind_at)).where(Reminder.status == 'pending'))
 
 async def check_reminders_job(context: CallbackContext):
     """
     Job function to check and send due reminders.
-    This function runs every 5 minutes via the job queue.
+    It reschedules itself for when the next reminder is due, at most REMINDER_CHECK_INTERVAL out.
     """
     logger.info("Running scheduled reminder check...")
+    delay = config.REMINDER_CHECK_INTERVAL
     try:
-        db = DatabaseHandler()
-        await send_due_reminders(context.bot, db)
+        await send_due_reminders(context.bot, db_handler)
+        next_due = await db_handler.run_in_thread(_next_due_time)
+        if next_due is not None:
+            if next_due.tzinfo is None:  # SQLite hands back naive UTC
+                next_due = next_due.replace(tzinfo=timezone.utc)
+            delay = (next_due - datetime.now(timezone.utc)).total_seconds()
     except Exception as e:
         logger.error(f"Error in reminder check job: {str(e)}")
+    finally:
+        db_handler.remove_session()
+        context.job_queue.run_once(
+            check_reminders_job,
+            when=min(max(delay, REMINDER_CHECK_MIN_DELAY), config.REMINDER_CHECK_INTERVAL)
+        )
 
 # Manual Test for reminders
 async def check_reminders_command(update: Update, context: CallbackContext):
     """Manual command to check reminders for testing."""
     await update.message.reply_text("Checking reminders...")
-    db = DatabaseHandler()
-    await send_due_reminders(context.bot, db)
+    await send_due_reminders(context.bot, db_handler)
     await update.message.reply_text("Reminder check completed!")
 
+def _mark_missed_reminders(session, current_utc):
+    """Flag sent reminders left untouched for 24 hours as missed; returns the count per user"""
+    cutoff_time = current_utc - timedelta(hours=24)
+    
+    is_missed = (
+        (Reminder.status == 'sent')
+        & (Reminder.last_reminded_at <= cutoff_time)
+        & (Reminder.is_snoozed == False)
+    )
+    
+    # Missed reminders per user, for the analytics counters
+    missed_by_user = dict(session.execute(
+        select(Link.user_id, func.count(Reminder.id))
+        .join(Reminder.link)
+        .where(is_missed)
+        .group_by(Link.user_id)
+    ).all())
+    
+    if missed_by_user:
+        session.execute(
+            update(Reminder)
+            .where(is_missed)
+            .values(status='missed')
+            .execution_options(synchronize_session=False)
+        )
+        db_handler.increment_analytics_many(session, 'missed_reminders', missed_by_user)
+    return missed_by_user
+
 async def check_missed_reminders(bot, db_handler):
     """Check for reminders that weren't interacted with in 24 hours"""
-    session = None
     try:
-        session = db_handler.get_session()
-        current_utc = datetime.now(timezone.utc)
-        cutoff_time = current_utc - timedelta(hours=24)
-        
-        missed_reminders = (
-            session.query(Reminder)
-            .join(Link)
-            .join(User)
-            .filter(
-                Reminder.status == 'sent',
-                Reminder.last_reminded_at <= cutoff_time,
-                Reminder.is_snoozed == False
-            )
-            .all()
+        missed_by_user = await db_handler.run_in_thread(
+            _mark_missed_reminders, datetime.now(timezone.utc)
         )
-        
-        for reminder in missed_reminders:
-            try:
-                reminder.status = 'missed'
-                db_handler.update_user_analytics(
-                    reminder.link.user.id, 
-                    'reminder_missed', 
-                    session=session
-                )
-            except Exception as e:
-                logger.error(f"Failed to process missed reminder {reminder.id}: {str(e)}")
-                continue
-                
-        session.commit()
+        if missed_by_user:
+            logger.info(f"Marked {sum(missed_by_user.values())} reminders as missed")
         
     except Exception as e:
         logger.error(f"Error checking missed reminders: {str(e)}")
-        if session:
-            session.rollback()
-    finally:
-        if session:
-            session.close()
 
 async def check_missed_reminders_job(context: CallbackContext):
     """Job function to check missed reminders daily"""
     logger.info("Running missed reminders check...")
     try:
-        db = DatabaseHandler()
-        await check_missed_reminders(context.bot, db)
+        await check_missed_reminders(context.bot, db_handler)
     except Exception as e:
         logger.error(f"Error in missed reminders check job: {str(e)}")
+    finally:
+        db_handler.remove_session()
+
+async def archive_reminders_job(context: CallbackContext):
+    """Job function to move finished reminders to the archive nightly"""
+    logger.info("Running reminder archive...")
+    try:
+        # Runs in a worker thread with its own session, off the event loop
+        archived = await db_handler.run_in_thread(db_handler.archive_reminders)
+        logger.info(f"Archived {archived} finished reminders")
+    except Exception as e:
+        logger.error(f"Error in reminder archive job: {str(e)}")
+
+async def flush_analytics_job(context: CallbackContext):
+    """Job function to write queued analytics events to the database"""
+    try:
+        await analytics_buffer.flush_in_thread()
+    except Exception as e:
+        logger.error(f"Error in analytics flush job: {str(e)}")
+
+async def flush_analytics_on_shutdown(application):
+    """Write any analytics events still queued when the bot stops"""
+    try:
+        await analytics_buffer.flush_in_thread()
+    except Exception as e:
+        logger.error(f"Error flushing analytics on shutdown: {str(e)}")
+
+async def release_db_session(update: Update, context: CallbackContext):
+    """Discard the task-scoped database session after all handlers for an update ran"""
+    db_handler.remove_session()
+
+def _snooze_reminder(session, reminder_id):
+    """Push a reminder to 9 AM tomorrow local time; returns (user, remind_at, offset) or None if it's gone"""
+    # The link and its user are joined into the same query
+    reminder = session.get(Reminder, reminder_id, options=REMINDER_WITH_USER)
+    if not reminder:
+        return None
+
+    # Get user's timezone
+    user = reminder.link.user
+    user_timezone = user.tz_offset_minutes
+    
+    # Set new reminder time for tomorrow at 9 AM in user's timezone
+    utc_next_day = next_reminder_time(datetime.now(timezone.utc), user_timezone)
+    
+    reminder.remind_at = utc_next_day
+    reminder.status = 'pending'
+    reminder.is_snoozed = True
+    reminder.snooze_count += 1
+    return user, utc_next_day, user_timezone
 
 async def handle_snooze(update: Update, context: CallbackContext):
     """Handle snooze button clicks."""
@@ -1107,33 +996,15 @@ async def handle_snooze(update: Update, context: CallbackContext):
     
     try:
         # Get reminder ID from callback data
-        reminder_id = int(query.data.replace("snooze_", ""))
-        
-        # Get reminder from database
-        db = DatabaseHandler()
-        session = db.get_session()
+        reminder_id = int(query.data.partition("_")[2])
         
         try:
-            reminder = session.query(Reminder).get(reminder_id)
+            # The update runs in a worker thread so the event loop keeps serving updates
+            result = await db_handler.run_in_thread(_snooze_reminder, reminder_id)
             
-            if reminder:
-                # Get user's timezone
-                user = session.query(User).filter_by(telegram_id=query.from_user.id).first()
-                user_timezone = user.timezone if user else None
-                
-                # Set new reminder time for tomorrow at 9 AM in user's timezone
-                now = datetime.now(timezone.utc)
-                local_time = get_user_local_time(now, user_timezone)
-                local_next_day = local_time.replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=1)
-                utc_next_day = get_utc_time(local_next_day, user_timezone)
-                
-                reminder.remind_at = utc_next_day
-                reminder.status = 'pending'
-                reminder.is_snoozed = True
-                reminder.snooze_count += 1
-                session.commit()
-                reminder.remind_at = utc_next_day
-                db.update_user_analytics(user.id, 'snooze', session=session)
+            if result:
+                user, utc_next_day, user_timezone = result
+                analytics_buffer.record(user.id, 'snooze')
                 local_time = get_user_local_time(utc_next_day, user_timezone)
                 formatted_time = local_time.strftime("%B %d at %I:%M %p")
                 await query.edit_message_text(
@@ -1152,11 +1023,6 @@ async def handle_snooze(update: Update, context: CallbackContext):
                 "⚠️ Failed to snooze reminder. Please try again later.",
                 reply_markup=None
             )
-            if session:
-                session.rollback()
-        finally:
-            if session:
-                session.close()
                 
     except Exception as e:
         logger.error(f"Error parsing snooze callback: {str(e)}")
@@ -1296,7 +1162,14 @@ def main():
         print("Attempting to start bot...")
         
         # Create the Application
-        application = Application.builder().token(config.TELEGRAM_TOKEN).build()
+        application = (
+            Application.builder()
+            .token(config.TELEGRAM_TOKEN)
+            # Handle updates in parallel (even several from one user); sessions are scoped per task
+            .concurrent_updates(config.CONCURRENT_UPDATES)
+            .post_shutdown(flush_analytics_on_shutdown)
+            .build()
+        )
 
         # Add command handlers
         application.add_handler(CommandHandler("start", start))
@@ -1310,29 +1183,37 @@ def main():
         application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
         
         # Add timezone handlers BEFORE the general reminder handler
-        application.add_handler(CallbackQueryHandler(handle_region_selection, pattern="^region_"))
-        application.add_handler(CallbackQueryHandler(handle_timezone_selection, pattern="^timezone_"))
+        application.add_handler(CallbackQueryHandler(handle_region_selection, pattern=REGION_CALLBACK_PATTERN))
+        application.add_handler(CallbackQueryHandler(handle_timezone_selection, pattern=TIMEZONE_CALLBACK_PATTERN))
 
         # Add delete confirmation handler
-        application.add_handler(CallbackQueryHandler(handle_delete_confirmation, pattern="^confirm_delete|cancel_delete$"))
+        application.add_handler(CallbackQueryHandler(handle_delete_confirmation, pattern=DELETE_CALLBACK_PATTERN))
 
         # Add pagination handler
-        application.add_handler(CallbackQueryHandler(handle_list_pagination, pattern="^list_"))
+        application.add_handler(CallbackQueryHandler(handle_list_pagination, pattern=LIST_CALLBACK_PATTERN))
         
         # Add snooze handler
-        application.add_handler(CallbackQueryHandler(handle_snooze, pattern="^snooze_"))
+        application.add_handler(CallbackQueryHandler(handle_snooze, pattern=SNOOZE_CALLBACK_PATTERN))
 
         # Add reminder handler last (as it's more generic)
-        application.add_handler(CallbackQueryHandler(handle_reminder_callback))
+        application.add_handler(CallbackQueryHandler(handle_reminder_callback, pattern=REMINDER_CALLBACK_PATTERN))
+        
+        # Release the per-update database session after the handlers above
+        application.add_handler(TypeHandler(Update, release_db_session), group=1)
         
         # Add error handler
         application.add_error_handler(error_handler)
 
         # Set up job queue for checking reminders
         job_queue = application.job_queue
-        job_queue.run_repeating(check_reminders_job, interval=300, first=10)  # 300 seconds = 5 minutes
-        logger.info("Reminder check job scheduled to run every 5 minutes")
+        job_queue.run_once(check_reminders_job, when=10)  # Reschedules itself after each run
+        logger.info(
+            f"Reminder check job scheduled to run when reminders are due, "
+            f"at least every {config.REMINDER_CHECK_INTERVAL} seconds"
+        )
         job_queue.run_daily(check_missed_reminders_job, time=time(hour=0, minute=0))
+        job_queue.run_daily(archive_reminders_job, time=time(hour=3, minute=0))
+        job_queue.run_repeating(flush_analytics_job, interval=ANALYTICS_FLUSH_INTERVAL, first=ANALYTICS_FLUSH_INTERVAL)
 
         # Start the Bot
         print("Bot is starting...")
@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+from contextlib import contextmanager
+from utils.analytics_buffer import AnalyticsBuffer
+
+class RecordingHandler:
+    """Stands in for DatabaseHandler and records the batched upserts"""
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+    @contextmanager
+    def session_scope(self):
+        yield None
+
+    async def run_in_thread(self, work, *args):
+        return await asyncio.to_thread(work, None, *args)
+
+    def increment_analytics_many(self, session, column, deltas_by_user):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.calls.append((column, dict(deltas_by_user)))
+
+def test_flush_groups_events_per_column_and_user():
+    """Test that queued events are summed into one upsert per column"""
+    handler = RecordingHandler()
+    buffer = AnalyticsBuffer(handler)
+    buffer.record(1, 'link_saved', 2)
+    buffer.record(1, 'link_saved')
+    buffer.record(2, 'link_saved')
+    buffer.record(1, 'snooze')
+
+    assert buffer.flush() == 3
+    assert sorted(handler.calls) == [
+        ('total_links_saved', {1: 3, 2: 1}),
+        ('total_snoozes', {1: 1}),
+    ]
+    assert buffer.flush() == 0
+
+def test_unknown_action_is_ignored():
+    """Test that actions without a counter column are not queued"""
+    buffer = AnalyticsBuffer(RecordingHandler())
+    buffer.record(1, 'default_reminder_removed')
+    assert buffer.queue.empty()
+
+def test_failed_flush_requeues_events():
+    """Test that events survive a failed write for the next flush"""
+    handler = RecordingHandler(fail=True)
+    buffer = AnalyticsBuffer(handler)
+    buffer.record(1, 'reminder_completed')
+    buffer.record(1, 'reminder_completed')
+
+    with pytest.raises(RuntimeError):
+        buffer.flush()
+
+    handler.fail = False
+    assert buffer.flush() == 1
+    assert handler.calls == [('completed_reminders', {1: 2})]
+
+def test_flush_in_thread_writes_and_requeues():
+    """Test that the threaded flush writes the same batch and keeps events on failure"""
+    handler = RecordingHandler(fail=True)
+    buffer = AnalyticsBuffer(handler)
+
+    async def scenario():
+        buffer.record(1, 'snooze')
+        with pytest.raises(RuntimeError):
+            await buffer.flush_in_thread()
+        handler.fail = False
+        return await buffer.flush_in_thread()
+
+    assert asyncio.run(scenario()) == 1
+    assert handler.calls == [('total_snoozes', {1: 1})]
@@ -151,4 +151,27 @@ def test_missing_required_settings(tmp_path):
     
     os.environ['ENV_FILE'] = str(env_file)
     with pytest.raises(ValueError):
-        Config()
\ No newline at end of file
+        Config()
+
+
+def test_settings_cached_per_environment(tmp_path):
+    """Test that an unchanged environment reuses parsed settings and a changed one does not"""
+    env_file = tmp_path / '.env'
+    write_env_file(env_file, """
+    ENVIRONMENT=development
+    TELEGRAM_TOKEN=test_token
+    DATABASE_URL=sqlite:///test.db
+    BOT_USERNAME=test_bot
+    """)
+    
+    os.environ['ENV_FILE'] = str(env_file)
+    first = Config()
+    Config.reset()
+    second = Config()
+    assert second is not first
+    assert second.TELEGRAM_TOKEN == first.TELEGRAM_TOKEN
+    
+    Config.reset()
+    os.environ['RATE_LIMIT_LINKS'] = '7'
+    third = Config()
+    assert third.RATE_LIMIT_LINKS == 7
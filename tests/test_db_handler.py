@@ -3,6 +3,7 @@ import pytest
 import logging
 from sqlalchemy.orm import Session
 from models_dir.models import User
+from database.db_handler import get_or_create_user
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -82,4 +83,17 @@ def test_create_duplicate_user(db_session: Session):
 
     except Exception as e:
         logger.error(f"Test failed: {str(e)}")
-        raise
\ No newline at end of file
+        raise
+
+def test_get_or_create_user_reuses_existing_user(db_session: Session):
+    """Test that creating an existing user returns it instead of failing"""
+    user, created = get_or_create_user(db_session, 123456, "test_user", "Test")
+    db_session.commit()
+    assert created is True
+
+    same_user, created = get_or_create_user(db_session, 123456, "different_username")
+    db_session.commit()
+    assert created is False
+    assert same_user.id == user.id
+    assert same_user.username == "test_user"
+    assert db_session.query(User).filter_by(telegram_id=123456).count() == 1
@@ -85,4 +85,16 @@ def test_mark_link_as_read(db_session: Session, test_user: User):
 
     except Exception as e:
         logger.error(f"Test failed: {str(e)}")
-        raise
\ No newline at end of file
+        raise
+
+
+def test_link_rejects_non_http_url(test_user: User):
+    """Test that non-http(s) URLs are rejected before reaching the database"""
+    with pytest.raises(ValueError):
+        Link(user_id=test_user.id, url="ftp://example.com")
+
+
+def test_link_rejects_overlong_url(test_user: User):
+    """Test that URLs longer than the column allows are rejected"""
+    with pytest.raises(ValueError):
+        Link(user_id=test_user.id, url="https://example.com/" + "a" * 2083)
@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+from utils.user_cache import UserCache
+
+def make_user(user_id, tz_offset_minutes=None):
+    return SimpleNamespace(id=user_id, tz_offset_minutes=tz_offset_minutes, has_set_timezone=tz_offset_minutes is not None)
+
+def test_set_and_get():
+    """Test that a cached user is returned with its fields"""
+    cache = UserCache()
+    cache.set(100, make_user(1, 330))
+    cached = cache.get(100)
+    assert (cached.id, cached.tz_offset_minutes, cached.has_set_timezone) == (1, 330, True)
+
+def test_entries_expire():
+    """Test that entries are dropped once their TTL has passed"""
+    cache = UserCache(ttl=0)
+    cache.set(100, make_user(1))
+    assert cache.get(100) is None
+
+def test_invalidate_and_eviction():
+    """Test invalidation and that the oldest entry is evicted when full"""
+    cache = UserCache(maxsize=2)
+    cache.set(100, make_user(1))
+    cache.set(200, make_user(2))
+    cache.set(300, make_user(3))
+    assert cache.get(100) is None
+    assert cache.get(200).id == 2
+
+    cache.invalidate(200)
+    assert cache.get(200) is None
+    assert cache.get(300).id == 3
@@ -0,0 +1,77 @@
+# utils/analytics_buffer.py
+import asyncio
+import logging
+from collections import Counter, defaultdict
+
+from database.db_handler import ACTION_TO_COLUMN
+
+logger = logging.getLogger(__name__)
+
+class AnalyticsBuffer:
+    """Queues analytics events in memory and writes them to the database in batches"""
+
+    def __init__(self, db_handler):
+        self.db_handler = db_handler
+        self.queue = asyncio.Queue()
+
+    def record(self, user_id, action_type, count=1):
+        """Queue an analytics event; actions without a counter column are ignored"""
+        column = ACTION_TO_COLUMN.get(action_type)
+        if column is not None:
+            self.queue.put_nowait((user_id, column, count))
+
+    def _drain(self):
+        """Take everything queued so far, summed per (column, user_id)"""
+        counts = Counter()
+        while True:
+            try:
+                user_id, column, count = self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return counts
+            counts[column, user_id] += count
+
+    def _requeue(self, counts):
+        """Put drained totals back so the next flush retries them"""
+        for (column, user_id), total in counts.items():
+            self.queue.put_nowait((user_id, column, total))
+
+    def _write(self, session, counts):
+        """Run one upsert per counter column in the given session"""
+        deltas_by_column = defaultdict(dict)
+        for (column, user_id), total in counts.items():
+            deltas_by_column[column][user_id] = total
+
+        for column, deltas in deltas_by_column.items():
+            self.db_handler.increment_analytics_many(session, column, deltas)
+
+    def flush(self):
+        """Write queued events with one upsert per counter column; returns the number of rows touched"""
+        counts = self._drain()
+        if not counts:
+            return 0
+
+        try:
+            with self.db_handler.session_scope() as session:
+                self._write(session, counts)
+        except Exception as e:
+            logger.error(f"Error flushing analytics: {str(e)}")
+            self._requeue(counts)
+            raise
+
+        return len(counts)
+
+    async def flush_in_thread(self):
+        """Like flush, but the database write runs in a worker thread off the event loop"""
+        # The queue is only touched here, on the event loop
+        counts = self._drain()
+        if not counts:
+            return 0
+
+        try:
+            await self.db_handler.run_in_thread(self._write, counts)
+        except Exception as e:
+            logger.error(f"Error flushing analytics: {str(e)}")
+            self._requeue(counts)
+            raise
+
+        return len(counts)
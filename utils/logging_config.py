@@ -1,10 +1,16 @@
 # utils/logging_config.py
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 import re
 from config.config import Config, Environment
 
+# Background listener that owns the file handlers
+_queue_listener = None
+
 class SensitiveDataFilter(logging.Filter):
     """Filter that masks sensitive data in log records"""
     def __init__(self):
@@ -68,9 +74,16 @@ class SensitiveDataFilter(logging.Filter):
 
 def setup_logging():
     """Configure logging with appropriate levels for different components"""
+    global _queue_listener
+    
     # Get config instance
     config = Config.get_instance()
     
+    # Stop a listener left over from a previous setup
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    
     # Clear any existing handlers
     root_logger = logging.getLogger()
     if root_logger.handlers:
@@ -130,10 +143,15 @@ def setup_logging():
     # Add filter to root logger
     root_logger.addFilter(sensitive_filter)
     
-    # Add handlers and filters
-    for handler in handlers:
-        handler.addFilter(sensitive_filter)
-        root_logger.addHandler(handler)
+    # File handlers run on a listener thread so log calls never wait on disk I/O
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.addFilter(sensitive_filter)
+        root_logger.addHandler(queue_handler)
+        
+        _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
     
     # Add console handler last
     console_handler.addFilter(sensitive_filter)
@@ -151,4 +169,11 @@ def setup_logging():
             logging.getLogger(logger_name).setLevel(logging.WARNING)
     
     # Log startup message
-    logging.info(f"Logging setup completed. Environment: {config.ENVIRONMENT}, Using log directory: {log_dir}")
\ No newline at end of file
+    logging.info(f"Logging setup completed. Environment: {config.ENVIRONMENT}, Using log directory: {log_dir}")
+
+def _stop_queue_listener():
+    """Flush queued records to the log files on interpreter exit"""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+atexit.register(_stop_queue_listener)
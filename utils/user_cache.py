@@ -0,0 +1,49 @@
+# utils/user_cache.py
+import threading
+import time
+from typing import NamedTuple, Optional
+
+class CachedUser(NamedTuple):
+    """The User fields handlers need on every update"""
+    id: int
+    tz_offset_minutes: Optional[int]
+    has_set_timezone: bool
+
+class UserCache:
+    """Short-lived telegram_id -> CachedUser cache to skip repeated user lookups"""
+
+    def __init__(self, ttl=60, maxsize=10_000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # {telegram_id: (expires_at, CachedUser)}, oldest first
+        self._entries = {}
+        # Handlers also run database work in worker threads
+        self._lock = threading.Lock()
+
+    def get(self, telegram_id):
+        """Return the cached user, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(telegram_id)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if expires_at <= time.monotonic():
+                del self._entries[telegram_id]
+                return None
+            return user
+
+    def set(self, telegram_id, user):
+        """Cache a User row's fields and return them as a CachedUser"""
+        cached = CachedUser(user.id, user.tz_offset_minutes, bool(user.has_set_timezone))
+        with self._lock:
+            self._entries.pop(telegram_id, None)
+            if len(self._entries) >= self.maxsize:
+                # Evict the oldest entry
+                del self._entries[next(iter(self._entries))]
+            self._entries[telegram_id] = (time.monotonic() + self.ttl, cached)
+        return cached
+
+    def invalidate(self, telegram_id):
+        """Drop a user after their row changes"""
+        with self._lock:
+            self._entries.pop(telegram_id, None)
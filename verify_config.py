@@ -1,10 +1,10 @@
 from config.config import Config
 import os
 
-config = Config.get_instance()
-
 def verify_config():
     """Verify configuration loading and settings"""
+    config = Config.get_instance()
+    
     print("\n=== Configuration Verification ===\n")
     
     # Check environment